@@ -3,6 +3,10 @@
 CWD=$( cd -- "$( dirname -- "${BASH_SOURCE[0]}" )" &> /dev/null && pwd )
 JOBS=20
 
+# Static dependencies are built with link-time optimization, so the Python
+# extension (also built with LTO) can optimize across them.
+CMAKE_LTO="-DCMAKE_BUILD_TYPE=Release -DCMAKE_INTERPROCEDURAL_OPTIMIZATION=ON -DCMAKE_POLICY_DEFAULT_CMP0069=NEW"
+
 mkdir depends
 cd depends
 
@@ -14,12 +18,12 @@ git clone --branch v0.5.2 https://github.com/jeremy-rifkin/cpptrace.git || exit
 
 # build fmt
 cd $CWD/depends/fmt
-cmake -B build || exit
+cmake -B build $CMAKE_LTO || exit
 cmake --build build --parallel $JOBS || exit
 
 # build rocksdb
 cd $CWD/depends/rocksdb
-cmake -B build || exit
+cmake -B build $CMAKE_LTO -DWITH_JEMALLOC=ON -DWITH_TESTS=OFF -DWITH_BENCHMARK_TOOLS=OFF || exit
 cmake --build build --parallel $JOBS || exit
 
 // build dwarf
@@ -32,7 +36,7 @@ ninja test || exit
 
 # build cpptrace
 cd $CWD/depends/cpptrace
-cmake -B build || exit
+cmake -B build $CMAKE_LTO || exit
 cmake --build build --parallel $JOBS || exit
 
 cd $CWD/pyext
@@ -435,11 +435,7 @@ class Key
             case INT:   return nodel::int_to_str(m_repr.i);
             case UINT:  return nodel::int_to_str(m_repr.u);
             case FLOAT: return nodel::float_to_str(m_repr.f);
-            case STR: {
-                StringStream ss;
-                ss << std::quoted(m_repr.s.data());
-                return ss.str();
-            }
+            case STR:   return quoted(m_repr.s.data());
             default:
                 throw wrong_type(m_repr_ix);
         }
@@ -527,7 +527,7 @@ class OPath
             auto child = obj.get(key);
             ASSERT(!child.is_empty());
             if (child == nil) return child;
-            obj.refer_to(child);
+            obj = std::move(child);
         }
         return obj;
     }
@@ -569,7 +569,7 @@ class OPath
                     child = Object{(*it).is_any_int()? Object::LIST: Object::OMAP};
                     obj.set(*prev_it, child);
                 }
-                obj.refer_to(child);
+                obj = std::move(child);
                 prev_it = it;
             }
             return obj.set(*prev_it, last_value);
@@ -1176,10 +1176,10 @@ Object::Object(DataSourcePtr ptr) : m_repr{ptr}, m_fields{DSRC} {}  // DataSourc
 inline
 Object::Object(const ObjectList& list) : m_repr{new IRCList(ObjectList{}, NoParent{})}, m_fields{LIST} {
     auto& my_list = std::get<0>(*m_repr.pl);
-    for (auto value : list) {
-        value = value.copy();
-        my_list.push_back(value);
-        value.set_parent(*this);
+    my_list.reserve(list.size());
+    for (auto& value : list) {
+        auto& copy = my_list.emplace_back(value.copy());
+        copy.set_parent(*this);
     }
 }
 
@@ -2003,11 +2003,21 @@ void Object::del(const Key& key) {
 /// @throws EmptyReference
 inline
 void Object::del(const OPath& path) {
-    auto obj = path.lookup(*this);
-    if (obj != nil) {
-        auto par = obj.parent();
-        par.del(par.key_of(obj));
+    if (path.m_keys.empty()) {
+        del_from_parent();
+        return;
+    }
+
+    // walk to the parent of the leaf, and delete by key instead of searching the parent for the leaf
+    Object par = *this;
+    auto leaf_it = path.m_keys.end() - 1;
+    for (auto it = path.m_keys.begin(); it != leaf_it; ++it) {
+        auto child = par.get(*it);
+        if (child == nil) return;
+        par = std::move(child);
     }
+    if (par.get(*leaf_it) != nil)
+        par.del(*leaf_it);
 }
 
 /// Delete this Object from its parent container.
@@ -2553,7 +2563,7 @@ void Object::to_json(std::ostream& os) const {
             case INT:   os << int_to_str(object.m_repr.i); break;
             case UINT:  os << int_to_str(object.m_repr.u); break;
             case FLOAT: os << float_to_str(object.m_repr.f); break;
-            case STR:   os << std::quoted(std::get<0>(*object.m_repr.ps)); break;
+            case STR:   write_quoted(os, std::get<0>(*object.m_repr.ps)); break;
             case LIST:  os << ((event & WalkDF::BEGIN_PARENT)? '[': ']'); break;
             case SMAP:  [[fallthrough]];
             case OMAP:  os << ((event & WalkDF::BEGIN_PARENT)? '{': '}'); break;
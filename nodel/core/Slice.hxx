@@ -152,10 +152,16 @@ T get_slice(const T& array, Int start, Int stop, Int step) {
     T result;
     auto it = array.cbegin() + start;
     auto end = array.cbegin() + stop;
-    if (step > 0) {
+    if (step == 1) {
+        if (it < end) result.assign(it, end);
+    } else if (step == -1) {
+        if (it > end) result.assign(std::make_reverse_iterator(it + 1), std::make_reverse_iterator(end + 1));
+    } else if (step > 0) {
+        if (it < end) result.reserve((stop - start + step - 1) / step);
         for (; it < end; it += step)
             result.push_back(*it);
     } else {
+        if (it > end) result.reserve((start - stop - step - 1) / -step);
         for (; it > end; it += step)
             result.push_back(*it);
     }
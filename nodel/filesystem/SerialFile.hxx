@@ -6,6 +6,7 @@
 
 #include <nodel/core/Object.hxx>
 #include <nodel/support/Ref.hxx>
+#include <nodel/support/MappedFile.hxx>
 #include <nodel/serializer/Serializer.hxx>
 
 #include <fstream>
@@ -33,6 +34,9 @@ class SerialFile : public File
     void read(const Object& target) override;
     void write(const Object& target, const Object& cache) override;
 
+  private:
+    void read_stream(const Object& target, const std::string& fpath, std::istream& f_in, size_t size);
+
   private:
     Ref<Serializer> mr_serial;
 };
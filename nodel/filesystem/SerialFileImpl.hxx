@@ -6,8 +6,19 @@ inline
 void SerialFile::read(const Object& target) {
     auto fpath = path(target).string();
     auto size = std::filesystem::file_size(fpath);
-    std::ifstream f_in{fpath, std::ios::in | std::ios::binary};
 
+    MappedFile f_map{fpath};
+    if (f_map.is_open()) {
+        std::istream f_in{&f_map};
+        read_stream(target, fpath, f_in, size);
+    } else {
+        std::ifstream f_in{fpath, std::ios::in | std::ios::binary};
+        read_stream(target, fpath, f_in, size);
+    }
+}
+
+inline
+void SerialFile::read_stream(const Object& target, const std::string& fpath, std::istream& f_in, size_t size) {
     Object obj = mr_serial->read(f_in, size);
     if (!obj.is_valid()) {
         report_read_error(fpath, obj.to_str());
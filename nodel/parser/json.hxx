@@ -4,9 +4,11 @@
 
 #include <nodel/core/Object.hxx>
 #include <nodel/support/parse.hxx>
+#include <nodel/support/MappedFile.hxx>
 #include <nodel/support/exception.hxx>
 
 #include <ctype.h>
+#include <charconv>
 #include <cstdlib>
 #include <cerrno>
 #include <sstream>
@@ -40,6 +42,7 @@ struct Parser
     bool parse_object(char term_char);
     bool parse_number();
     bool parse_string();
+    bool parse_string(std::string& str);
     bool parse_map();
     bool parse_list();
 
@@ -180,27 +183,37 @@ bool Parser<StreamType>::parse_number() {
         m_scratch.push_back(c);
     }
 
-    const char* str = m_scratch.c_str();
+    const char* str = m_scratch.data();
     const char* scratch_end = str + m_scratch.size();
-    char* end = 0;
+
+    // from_chars does not accept a leading '+', which strtod and strtoll do, so it is
+    // skipped, unless it is followed by a '-', which neither accepts
+    if (str != scratch_end && *str == '+' && (str + 1 == scratch_end || str[1] != '-')) ++str;
+
+    std::from_chars_result result;
     if (is_float) {
-        m_curr.refer_to(Object{strtod(str, &end)});
+        Float value;
+        result = std::from_chars(str, scratch_end, value);
+        if (result.ec == std::errc{}) m_curr.refer_to(Object{value});
     } else {
-        errno = 0;
-        m_curr.refer_to(Object{strtoll(str, &end, 10)});
-        if (errno) {
-            errno = 0;
-            m_curr.refer_to(Object{strtoull(str, &end, 10)});
+        Int value;
+        result = std::from_chars(str, scratch_end, value);
+        if (result.ec == std::errc{}) {
+            m_curr.refer_to(Object{value});
+        } else if (result.ec == std::errc::result_out_of_range && *str != '-') {
+            // a negative value that does not fit is a range error, too
+            UInt uvalue;
+            result = std::from_chars(str, scratch_end, uvalue);
+            if (result.ec == std::errc{}) m_curr.refer_to(Object{uvalue});
         }
     }
 
     m_scratch.clear();
 
-    if (errno) {
-        create_error(strerror(errno));
-        errno = 0;
+    if (result.ec == std::errc::result_out_of_range) {
+        create_error(strerror(ERANGE));
         return false;
-    } else if (end != scratch_end) {
+    } else if (result.ec != std::errc{} || result.ptr != scratch_end) {
         create_error("Numeric syntax error");
         return false;
     } else {
@@ -210,30 +223,37 @@ bool Parser<StreamType>::parse_number() {
 
 template <typename StreamType>
 bool Parser<StreamType>::parse_string() {
+    std::string str;
+    if (!parse_string(str)) return false;
+    m_curr.refer_to(std::move(str));
+    return true;
+}
+
+template <typename StreamType>
+bool Parser<StreamType>::parse_string(std::string& str) {
     char quote = m_it.peek();
     m_it.next();
-    bool escape = false;
-    std::string str;
-    for(; !m_it.done(); m_it.next()) {
-        char c = m_it.peek();
-        if (c == '\\') {
-            escape = true;
-        } else if (!escape) {
-            if (c == quote) { m_it.next(); quote = 0; break; }
-            str.push_back(c);
-        } else {
-            escape = false;
-            str.push_back(c);
+    while (!m_it.done()) {
+        // copy runs of plain characters in bulk
+        auto buf = m_it.buffer();
+        size_t n = find_either(buf, quote, '\\');
+        str.append(buf.data(), n);
+        m_it.skip(n);
+        if (n == buf.size()) continue;
+
+        if (m_it.peek() == quote) {
+            m_it.next();
+            return true;
         }
-    }
 
-    if (quote != 0) {
-        create_error("Unterminated string");
-        return false;
+        m_it.next();  // consume escape
+        if (m_it.done()) break;
+        str.push_back(m_it.peek());
+        m_it.next();
     }
 
-    m_curr.refer_to(std::move(str));
-    return true;
+    create_error("Unterminated string");
+    return false;
 }
 
 template <typename StreamType>
@@ -282,20 +302,33 @@ bool Parser<StreamType>::parse_map() {
 
     while (!m_it.done()) {
         // key
-        if (!parse_object(':')) {
-            create_error("Expected dictionary key");
-            return false;
-        }
+        Key key;
+        consume_whitespace();
+        char c = m_it.done()? 0: m_it.peek();
+        if (c == '"' || c == '\'') {
+            // intern directly from the scratch buffer, without a temporary string Object
+            m_scratch.clear();
+            if (!parse_string(m_scratch)) {
+                create_error("Expected dictionary key");
+                return false;
+            }
+            key = intern_string(m_scratch);
+        } else {
+            if (!parse_object(':')) {
+                create_error("Expected dictionary key");
+                return false;
+            }
 
-        Key key = m_curr.to_key();
+            key = m_curr.to_key();
 
-        if (nodel::is_container(m_curr)) {
-            create_error("Keys must be a primitive type");
-            return false;
+            if (nodel::is_container(m_curr)) {
+                create_error("Keys must be a primitive type");
+                return false;
+            }
         }
 
         consume_whitespace();
-        char c = m_it.peek();
+        c = m_it.peek();
         if (c != ':') {
             create_error("Expected token ':'");
             return false;
@@ -345,7 +378,20 @@ bool Parser<StreamType>::expect(const char* seq, T value) {
 template <typename StreamType>
 void Parser<StreamType>::consume_whitespace()
 {
-    while (!m_it.done() && std::isspace(m_it.peek())) m_it.next();
+    while (!m_it.done()) {
+        switch (m_it.peek()) {
+            case ' ':
+            case '\t':
+            case '\n':
+            case '\r':
+            case '\v':
+            case '\f':
+                m_it.next();
+                continue;
+            default:
+                return;
+        }
+    }
 }
 
 template <typename StreamType>
@@ -378,6 +424,10 @@ Object parse(const std::string_view& str) {
 
 inline
 Object parse_file(const Options& options, const std::string& file_name) {
+    MappedFile f_map{file_name};
+    if (f_map.is_open())
+        return parse(options, {f_map.data(), f_map.size()});
+
     std::ifstream f_in{file_name, std::ios::in};
     if (!f_in.is_open()) {
         std::stringstream ss;
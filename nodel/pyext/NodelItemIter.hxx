@@ -14,6 +14,7 @@ typedef struct {
     nodel::ItemRange range;
     nodel::ItemIterator it;
     nodel::ItemIterator end;
+    Py_ssize_t length_hint;  // remaining elements, or -1 if unknown
 } NodelItemIter;
 
 } // extern C
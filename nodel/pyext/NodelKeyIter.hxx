@@ -14,6 +14,7 @@ typedef struct {
     nodel::KeyRange range;
     nodel::KeyIterator it;
     nodel::KeyIterator end;
+    Py_ssize_t length_hint;  // remaining elements, or -1 if unknown
 } NodelKeyIter;
 
 } // extern C
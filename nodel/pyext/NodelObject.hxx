@@ -14,6 +14,7 @@ extern PyTypeObject NodelObjectType;
 typedef struct {
     PyObject_HEAD
     nodel::Object obj;
+    PyObject* native;  // result of nodel.native, cached for by-value types (nil, bool, and numbers)
 } NodelObject;
 
 extern NodelObject* NodelObject_wrap(const nodel::Object& obj);
@@ -14,6 +14,7 @@ typedef struct {
     nodel::ValueRange range;
     nodel::ValueIterator it;
     nodel::ValueIterator end;
+    Py_ssize_t length_hint;  // remaining elements, or -1 if unknown
 } NodelValueIter;
 
 } // extern C
@@ -0,0 +1,56 @@
+/// @b License: @n Apache License v2.0
+/// @copyright Robert Dunnagan
+#pragma once
+
+#include <Python.h>
+
+extern "C" {
+
+/// Table of functions exported by the nodel extension, as the capsule named by
+/// NodelCAPI_CAPSULE_NAME, so that other extensions can create and inspect
+/// nodel.Object instances without calling through the interpreter.
+/// - Import the table once, with NodelCAPI_Import, and keep the pointer.
+/// - Entries are only ever appended, so a table is compatible with every importer
+///   compiled against a header whose table is not larger.
+typedef struct {
+    /// The size of the table exported by the extension, in bytes.
+    size_t Size;
+
+    PyTypeObject* ObjectType;
+
+    /// Returns a new reference to a nodel.Object, or NULL with an exception set.
+    PyObject* (*FromLongLong)(long long value);
+    PyObject* (*FromDouble)(double value);
+    PyObject* (*FromStringAndSize)(const char* str, Py_ssize_t size);
+
+    /// Returns the nodel::Object::ReprIX of the argument (see nodel/core/Object.hxx),
+    /// or -1 with a TypeError set, if the argument is not a nodel.Object.
+    int (*Type)(PyObject* obj);
+
+    /// Returns 0 and stores the value, or -1 with a TypeError set, if the argument
+    /// is not an integer nodel.Object that fits.
+    int (*AsLongLong)(PyObject* obj, long long* value);
+
+    /// Writes the text that str(obj) would return, as UTF-8, into a caller-supplied
+    /// buffer, without creating a Python string.  Stores the full length of the
+    /// text in out_len and copies at most cap bytes, without a terminating null,
+    /// so the text was truncated if out_len is greater than cap.
+    /// Returns 0, or -1 with an exception set.
+    int (*StrInto)(PyObject* obj, char* buf, size_t cap, size_t* out_len);
+} NodelCAPI;
+
+#define NodelCAPI_CAPSULE_NAME "nodel._C_API"
+
+/// Returns the C API table of the nodel extension, importing the extension if
+/// necessary, or NULL with an exception set, including an ImportError if the
+/// extension is older than this header, and lacks some of its entries.
+static inline NodelCAPI* NodelCAPI_Import(void) {
+    NodelCAPI* capi = (NodelCAPI*)PyCapsule_Import(NodelCAPI_CAPSULE_NAME, 0);
+    if (capi != NULL && capi->Size < sizeof(NodelCAPI)) {
+        PyErr_SetString(PyExc_ImportError, "The nodel extension is older than the C API header it is imported by");
+        return NULL;
+    }
+    return capi;
+}
+
+} // extern C
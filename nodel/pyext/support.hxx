@@ -7,6 +7,9 @@
 #include <nodel/core/Object.hxx>
 #include <nodel/support/logging.hxx>
 
+#include <cstring>
+#include <optional>
+
 namespace nodel {
 
 namespace python {
@@ -27,6 +30,42 @@ class RefMgr
     PyObject* m_ref;
 };
 
+/// Bounded list of deallocated instances of a fixed-size extension type, reused
+/// by the type's tp_alloc slot, similar to the CPython freelists.
+/// - The type must not be variable-sized, garbage collected, or subclassable, so
+///   allocation skips the generic size computation and GC bookkeeping of
+///   PyType_GenericAlloc in favor of a constant-size PyObject_Malloc, and the
+///   default tp_free, PyObject_Free, releases instances that are not kept.
+/// - The GIL serializes access.
+template <typename T, int max_size>
+class FreeList
+{
+  public:
+    PyObject* alloc(PyTypeObject* type) {
+        PyObject* self;
+        if (m_size > 0) {
+            self = m_items[--m_size];
+        } else {
+            self = (PyObject*)PyObject_Malloc(sizeof(T));
+            if (self == NULL) return PyErr_NoMemory();
+        }
+        std::memset((char*)self + sizeof(PyObject), 0, sizeof(T) - sizeof(PyObject));  // as if by PyType_GenericAlloc
+        return PyObject_Init(self, type);
+    }
+
+    /// Keeps an instance whose fields have been destroyed, or returns false if
+    /// the list is full.
+    bool push(PyObject* self) {
+        if (m_size == max_size) return false;
+        m_items[m_size++] = self;
+        return true;
+    }
+
+  private:
+    PyObject* m_items[max_size];
+    int m_size = 0;
+};
+
 inline
 std::optional<std::string_view> to_string_view(PyObject* po) {
     RefMgr unicode;
@@ -120,12 +159,15 @@ struct Support
     static PyObject* to_str(const std::pair<Key, Object>& item);
 
     static PyObject* to_py(const Key& key);
+    static PyObject* to_py(const Object& obj);
 
     static Key to_key(PyObject* po);
     static Slice to_slice(PyObject* po);
     static Object to_object(PyObject* po);
 };
 
+inline Support support;
+
 
 inline
 PyObject* Support::to_str(const Key& key) {
@@ -188,6 +230,51 @@ PyObject* Support::to_py(const Key& key) {
     }
 }
 
+inline
+PyObject* Support::to_py(const Object& obj) {
+    switch (obj.m_fields.repr_ix) {
+        case Object::NIL:   Py_RETURN_NONE;
+        case Object::BOOL:  if (obj.m_repr.b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+        case Object::INT:   return PyLong_FromLongLong(obj.m_repr.i);
+        case Object::UINT:  return PyLong_FromUnsignedLongLong(obj.m_repr.u);
+        case Object::FLOAT: return PyFloat_FromDouble(obj.m_repr.f);
+        case Object::STR: {
+            const auto& str = std::get<0>(*obj.m_repr.ps);
+            return python::to_str(StringView{str.data(), str.size()});
+        }
+        case Object::LIST: {
+            const auto& list = std::get<0>(*obj.m_repr.pl);
+            RefMgr py_list = PyList_New(list.size());
+            if (py_list == NULL) return NULL;
+            Py_ssize_t i = 0;
+            for (const auto& value : list) {
+                PyObject* py_value = to_py(value);
+                if (py_value == NULL) return NULL;
+                PyList_SET_ITEM((PyObject*)py_list, i++, py_value);  // steals reference
+            }
+            return py_list.get_clear();
+        }
+        case Object::SMAP: [[fallthrough]];
+        case Object::OMAP: {
+            RefMgr py_dict = PyDict_New();
+            if (py_dict == NULL) return NULL;
+            for (const auto& [key, value] : obj.iter_items()) {
+                RefMgr py_key = to_py(key);
+                if (py_key == NULL) return NULL;
+                RefMgr py_value = to_py(value);
+                if (py_value == NULL) return NULL;
+                if (PyDict_SetItem(py_dict, py_key, py_value) == -1) return NULL;
+            }
+            return py_dict.get_clear();
+        }
+        case Object::DSRC:  return to_py(const_cast<DataSourcePtr>(obj.m_repr.ds)->get_cached(obj));
+        default: {
+            PyErr_SetString(PyExc_ValueError, "Invalid nodel::Object type");
+            return NULL;
+        }
+    }
+}
+
 inline
 Key Support::to_key(PyObject* po) {
     if (po == Py_None) {
@@ -249,6 +336,21 @@ Slice Support::to_slice(PyObject* po) {
 
 inline
 Object Support::to_object(PyObject* po) {
+    // exact builtin scalars are dispatched on the type pointer alone, before the subtype checks
+    PyTypeObject* type = Py_TYPE(po);
+    if (type == &PyFloat_Type) {
+        return PyFloat_AS_DOUBLE(po);
+    } else if (type == &PyUnicode_Type) {
+        Py_ssize_t size;
+        const char* buf = PyUnicode_AsUTF8AndSize(po, &size);
+        if (buf == NULL) return nil;
+        return String{buf, (String::size_type)size};
+    } else if (type == &PyLong_Type) {
+        int overflow;
+        Int v = PyLong_AsLongLongAndOverflow(po, &overflow);
+        if (overflow == 0) return v;
+    }
+
     if (po == Py_None) {
         return nil;
     } else if (PyUnicode_Check(po)) {
@@ -272,16 +374,21 @@ Object Support::to_object(PyObject* po) {
         return PyFloat_AsDouble(po);
     } else if (PyList_Check(po)) {
         Object list = Object::LIST;
+        auto& items = std::get<0>(*list.m_repr.pl);
         Py_ssize_t size = PyList_GET_SIZE(po);
+        items.reserve(size);
         for (Py_ssize_t i=0; i<size; i++) {
             PyObject* py_item = PyList_GET_ITEM(po, i);  // borrowed reference
             Object item = to_object(py_item);
             if (PyErr_Occurred()) return nil;
-            list.set(i, item);
+            // append directly, as Object::set would for the next index, without normalizing a Key
+            auto& elem = items.emplace_back((item.parent() == nil)? std::move(item): item.copy());
+            elem.set_parent(list);
         }
         return list;
     } else if (PyDict_Check(po)) {
         Object map = Object::OMAP;
+        std::get<0>(*map.m_repr.pom).reserve(PyDict_GET_SIZE(po));
         PyObject* key, *val;
         Py_ssize_t pos = 0;
         while (PyDict_Next(po, &pos, &key, &val)) {  // borrowed references
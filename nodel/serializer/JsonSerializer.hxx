@@ -5,6 +5,7 @@
 #include "Serializer.hxx"
 
 #include <nodel/support/parse.hxx>
+#include <nodel/support/MappedFile.hxx>
 #include <nodel/parser/json.hxx>
 
 #include <iostream>
@@ -20,6 +21,10 @@ class JsonSerializer : public Serializer
 
 inline
 Object JsonSerializer::read(std::istream& stream, size_t size_hint) {
+    // parse a memory-mapped file in place, rather than through the stream buffer
+    if (auto p_map = dynamic_cast<MappedFile*>(stream.rdbuf()); p_map != nullptr)
+        return json::parse({p_map->data(), p_map->size()});
+
     json::impl::Parser parser{parse::StreamAdapter{stream}};
     parser.parse_object();
     return parser.m_curr;
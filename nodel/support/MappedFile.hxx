@@ -0,0 +1,73 @@
+/// @b License: @n Apache License v2.0
+/// @copyright Robert Dunnagan
+#pragma once
+
+#include <streambuf>
+#include <string>
+
+#if __has_include(<sys/mman.h>)
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <fcntl.h>
+#include <unistd.h>
+#define NODEL_HAVE_MMAP 1
+#endif
+
+namespace nodel {
+
+/////////////////////////////////////////////////////////////////////////////
+/// A read-only memory map of a file, which is also a stream buffer over the
+/// mapped bytes.
+/// - Reading through the mapping avoids a read() system call and a copy per
+///   buffer fill; pages are faulted in on demand from the page cache.
+/// - If the file cannot be mapped (empty files, special files, or platforms
+///   without mmap) then `is_open()` returns false, and the caller should fall
+///   back to ordinary stream I/O.
+/////////////////////////////////////////////////////////////////////////////
+class MappedFile : public std::streambuf
+{
+  public:
+    MappedFile(const std::string& path);
+    ~MappedFile();
+
+    MappedFile(const MappedFile&) = delete;
+    MappedFile& operator = (const MappedFile&) = delete;
+
+    bool is_open() const     { return mp_data != nullptr; }
+    const char* data() const { return mp_data; }
+    size_t size() const      { return m_size; }
+
+  private:
+    char* mp_data = nullptr;
+    size_t m_size = 0;
+};
+
+inline
+MappedFile::MappedFile(const std::string& path) {
+#ifdef NODEL_HAVE_MMAP
+    int fd = ::open(path.c_str(), O_RDONLY);
+    if (fd == -1) return;
+
+    struct stat st;
+    if (::fstat(fd, &st) == 0 && S_ISREG(st.st_mode) && st.st_size > 0) {
+        void* p = ::mmap(nullptr, st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+        if (p != MAP_FAILED) {
+            ::madvise(p, st.st_size, MADV_SEQUENTIAL);
+            mp_data = (char*)p;
+            m_size = st.st_size;
+            setg(mp_data, mp_data, mp_data + m_size);
+        }
+    }
+
+    ::close(fd);  // the mapping remains valid
+#endif
+}
+
+inline
+MappedFile::~MappedFile() {
+#ifdef NODEL_HAVE_MMAP
+    if (mp_data != nullptr) ::munmap(mp_data, m_size);
+#endif
+}
+
+} // namespace nodel
@@ -17,7 +17,12 @@ class intern_t
     explicit intern_t(const StringView& str) : m_str{str} {}
     intern_t()                               : m_str{""} {}
 
-    bool operator == (intern_t other) const          { return m_str == other.m_str; }
+    bool operator == (intern_t other) const {
+        // interned strings with the same content share storage
+        if (m_str.data() == other.m_str.data()) return m_str.size() == other.m_str.size();
+        return m_str == other.m_str;
+    }
+
     bool operator == (const String& other) const     { return other == m_str; }
     bool operator == (const StringView& other) const { return other == m_str; }
     bool operator == (const char* other) const       { return m_str == other; }
@@ -4,6 +4,7 @@
 
 #include <algorithm>
 #include <array>
+#include <string_view>
 
 namespace nodel::parse {
 
@@ -18,8 +19,14 @@ class StreamAdapter  // TODO: replace with std::stream_iterator?
 
     char peek() { return m_buf[m_buf_pos]; }
 
-    void next() {
-        if (++m_buf_pos >= m_buf_size) {
+    void next() { skip(1); }
+
+    // contiguous characters available without refilling, for bulk scans
+    std::string_view buffer() const { return {m_buf.data() + m_buf_pos, m_buf_size - m_buf_pos}; }
+
+    void skip(size_t n) {
+        m_buf_pos += n;
+        if (m_buf_pos >= m_buf_size) {
             m_buf_pos = m_buf_size;
             if (!m_stream.eof())
                 fill();
@@ -68,6 +75,8 @@ class StringStreamAdapter
 
     char peek() { return m_str[m_pos]; }
     void next() { ++m_pos; }
+    std::string_view buffer() const { return {m_str.data() + m_pos, m_str.size() - m_pos}; }
+    void skip(size_t n) { m_pos += n; }
     size_t consumed() const { return m_pos; }
     bool done() const { return m_pos == m_str.size(); }
     bool error() const { return false; }
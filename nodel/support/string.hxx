@@ -5,6 +5,8 @@
 #include <string>
 #include <sstream>
 #include <charconv>
+#include <cstring>
+#include <cassert>
 #include <iomanip>
 
 #include <nodel/support/types.hxx>
@@ -12,54 +14,66 @@
 
 namespace nodel {
 
-// string quoting, in case std::quoted method is slow
+/// Returns the offset of the first occurrence of either character, or the size
+/// of the buffer if neither occurs.
+/// - Implemented with memchr, which the C library dispatches at load time to the
+///   widest vector unit available (SSE2/AVX2/AVX-512, NEON/SVE), so a single
+///   build scans at full speed on every host.
 inline
-std::string quoted(const std::string& str) {
-  std::stringstream ss;
-  ss << std::quoted(str);
-  return ss.str();
+size_t find_either(const StringView& buf, char a, char b) {
+    size_t n = buf.size();
+    if (n == 0) return 0;
+    if (auto p = (const char*)std::memchr(buf.data(), a, n); p != nullptr) n = p - buf.data();
+    if (auto p = (const char*)std::memchr(buf.data(), b, n); p != nullptr) n = p - buf.data();
+    return n;
 }
 
+/// Write a double-quoted string, escaping quotes and backslashes with a
+/// backslash (the same output as std::quoted), copying unescaped runs in bulk.
 inline
-std::string int_to_str(int32_t v) {
-    char buf[12];
-    auto len = std::snprintf(buf, 11, "%d", v);
-    assert (len > 0);
-    return {buf, (size_t)len};
+void write_quoted(std::ostream& os, StringView str) {
+    os.put('"');
+    while (!str.empty()) {
+        auto n = find_either(str, '"', '\\');
+        os.write(str.data(), n);
+        if (n == str.size()) break;
+        os.put('\\');
+        os.put(str[n]);
+        str.remove_prefix(n + 1);
+    }
+    os.put('"');
 }
 
 inline
-std::string int_to_str(int64_t v) {
-    char buf[24];
-    auto len = std::snprintf(buf, 23, "%lld", v);
-    assert (len > 0);
-    return {buf, (size_t)len};
-}
-
-inline
-std::string int_to_str(uint32_t v) {
-    char buf[12];
-    auto len = std::snprintf(buf, 11, "%u", v);
-    assert (len > 0);
-    return {buf, (size_t)len};
+std::string quoted(const StringView& str) {
+    std::string result;
+    result.reserve(str.size() + 2);
+    result.push_back('"');
+    for (auto c : str) {
+        if (c == '"' || c == '\\') result.push_back('\\');
+        result.push_back(c);
+    }
+    result.push_back('"');
+    return result;
 }
 
+// std::to_chars is locale-independent and does not parse a format string.
 inline
-std::string int_to_str(uint64_t v) {
+std::string int_to_str(is_integral auto v) {
     char buf[24];
-    auto len = std::snprintf(buf, 23, "%llu", v);
-    assert (len > 0);
-    return {buf, (size_t)len};
+    auto result = std::to_chars(buf, buf + sizeof(buf), v);
+    assert (result.ec == std::errc{});
+    return {buf, (size_t)(result.ptr - buf)};
 }
 
 inline
 std::string float_to_str(double v) {
-    char buf[26];
+    char buf[32];
     // There are 53-bits in IEEE 754 (64-bit float) standard, and log10(2**53) equals 15.95, so
-    // round to 15 digits precision.
-    auto len = std::snprintf(buf, 25, "%.15g", v);
-    assert (len > 0);
-    return {buf, (size_t)len};
+    // round to 15 digits precision (formatted as if by printf "%.15g").
+    auto result = std::to_chars(buf, buf + sizeof(buf), v, std::chars_format::general, 15);
+    assert (result.ec == std::errc{});
+    return {buf, (size_t)(result.ptr - buf)};
 }
 
 inline
@@ -12,18 +12,26 @@ extern "C" {
 using namespace nodel;
 using RefMgr = python::RefMgr;
 
-static python::Support support;
+using python::support;
 
 //-----------------------------------------------------------------------------
 // Type slots
 //-----------------------------------------------------------------------------
 
+// Recently freed iterators, reused by NodelItemIter_alloc.
+static nodel::python::FreeList<NodelItemIter, 16> freelist;
+
+static PyObject* NodelItemIter_alloc(PyTypeObject* type, Py_ssize_t nitems) {
+    return freelist.alloc(type);
+}
+
 static int NodelItemIter_init(PyObject* self, PyObject* args, PyObject* kwds) {
     NodelItemIter* nd_self = (NodelItemIter*)self;
 
     std::construct_at<ItemRange>(&nd_self->range);
     std::construct_at<ItemIterator>(&nd_self->it);
     std::construct_at<ItemIterator>(&nd_self->end);
+    nd_self->length_hint = -1;
 
     return 0;
 }
@@ -35,7 +43,7 @@ static void NodelItemIter_dealloc(PyObject* self) {
     std::destroy_at<ItemIterator>(&nd_self->it);
     std::destroy_at<ItemIterator>(&nd_self->end);
 
-    Py_TYPE(self)->tp_free(self);
+    if (!freelist.push(self)) Py_TYPE(self)->tp_free(self);
 }
 
 static PyObject* NodelItemIter_str(PyObject* self) {
@@ -47,7 +55,7 @@ static PyObject* NodelItemIter_repr(PyObject* arg) {
 }
 
 static PyObject* NodelItemIter_iter(PyObject* self) {
-    return self;
+    return Py_NewRef(self);
 }
 
 static PyObject* NodelItemIter_iter_next(PyObject* self) {
@@ -58,9 +66,21 @@ static PyObject* NodelItemIter_iter_next(PyObject* self) {
     RefMgr val = (PyObject*)NodelObject_wrap(item.second);
     PyObject* next = PyTuple_Pack(2, (PyObject*)key, (PyObject*)val);
     ++nd_self->it;
+    if (nd_self->length_hint > 0) --nd_self->length_hint;
     return next;
 }
 
+static PyObject* NodelItemIter_length_hint(PyObject* self, PyObject*) {
+    Py_ssize_t length_hint = ((NodelItemIter*)self)->length_hint;
+    if (length_hint < 0) Py_RETURN_NOTIMPLEMENTED;
+    return PyLong_FromSsize_t(length_hint);
+}
+
+static PyMethodDef NodelItemIter_methods[] = {
+    {"__length_hint__", (PyCFunction)NodelItemIter_length_hint, METH_NOARGS, NULL},
+    {NULL, NULL, 0, NULL}
+};
+
 //-----------------------------------------------------------------------------
 // Type definition
 //-----------------------------------------------------------------------------
@@ -75,7 +95,9 @@ PyTypeObject NodelItemIterType = {
     .tp_doc         = PyDoc_STR("Nodel item iterator"),
     .tp_iter        = NodelItemIter_iter,
     .tp_iternext    = NodelItemIter_iter_next,
+    .tp_methods     = NodelItemIter_methods,
     .tp_init        = NodelItemIter_init,
+    .tp_alloc       = NodelItemIter_alloc,
 };
 
 } // extern C
@@ -11,18 +11,26 @@ extern "C" {
 
 using namespace nodel;
 
-static python::Support support;
+using python::support;
 
 //-----------------------------------------------------------------------------
 // Type slots
 //-----------------------------------------------------------------------------
 
+// Recently freed iterators, reused by NodelKeyIter_alloc.
+static nodel::python::FreeList<NodelKeyIter, 16> freelist;
+
+static PyObject* NodelKeyIter_alloc(PyTypeObject* type, Py_ssize_t nitems) {
+    return freelist.alloc(type);
+}
+
 static int NodelKeyIter_init(PyObject* self, PyObject* args, PyObject* kwds) {
     NodelKeyIter* nd_self = (NodelKeyIter*)self;
 
     std::construct_at<KeyRange>(&nd_self->range);
     std::construct_at<KeyIterator>(&nd_self->it);
     std::construct_at<KeyIterator>(&nd_self->end);
+    nd_self->length_hint = -1;
 
     return 0;
 }
@@ -34,7 +42,7 @@ static void NodelKeyIter_dealloc(PyObject* self) {
     std::destroy_at<KeyIterator>(&nd_self->it);
     std::destroy_at<KeyIterator>(&nd_self->end);
 
-    Py_TYPE(self)->tp_free(self);
+    if (!freelist.push(self)) Py_TYPE(self)->tp_free(self);
 }
 
 static PyObject* NodelKeyIter_str(PyObject* self) {
@@ -46,7 +54,7 @@ static PyObject* NodelKeyIter_repr(PyObject* arg) {
 }
 
 static PyObject* NodelKeyIter_iter(PyObject* self) {
-    return self;
+    return Py_NewRef(self);
 }
 
 static PyObject* NodelKeyIter_iter_next(PyObject* self) {
@@ -54,9 +62,21 @@ static PyObject* NodelKeyIter_iter_next(PyObject* self) {
     if (nd_self->it == nd_self->end) return NULL;  // StopIteration implied
     PyObject* next = support.to_py(*nd_self->it);
     ++nd_self->it;
+    if (nd_self->length_hint > 0) --nd_self->length_hint;
     return next;
 }
 
+static PyObject* NodelKeyIter_length_hint(PyObject* self, PyObject*) {
+    Py_ssize_t length_hint = ((NodelKeyIter*)self)->length_hint;
+    if (length_hint < 0) Py_RETURN_NOTIMPLEMENTED;
+    return PyLong_FromSsize_t(length_hint);
+}
+
+static PyMethodDef NodelKeyIter_methods[] = {
+    {"__length_hint__", (PyCFunction)NodelKeyIter_length_hint, METH_NOARGS, NULL},
+    {NULL, NULL, 0, NULL}
+};
+
 //-----------------------------------------------------------------------------
 // Type definition
 //-----------------------------------------------------------------------------
@@ -71,7 +91,9 @@ PyTypeObject NodelKeyIterType = {
     .tp_doc         = PyDoc_STR("Nodel key iterator"),
     .tp_iter        = NodelKeyIter_iter,
     .tp_iternext    = NodelKeyIter_iter_next,
+    .tp_methods     = NodelKeyIter_methods,
     .tp_init        = NodelKeyIter_init,
+    .tp_alloc       = NodelKeyIter_alloc,
 };
 
 } // extern C
@@ -18,7 +18,7 @@ extern "C" {
 using namespace nodel;
 using RefMgr = python::RefMgr;
 
-static python::Support support;
+using python::support;
 
 
 //-----------------------------------------------------------------------------
@@ -66,28 +66,84 @@ static bool require_subscript(const Object& obj, const Key& key) {
 // NodelObject Number Protocol
 //-----------------------------------------------------------------------------
 
+enum class NumberOp { ADD, SUBTRACT, MULTIPLY };
+
+// Returns a new reference to the Python equivalent of a numeric Object, or a
+// new reference to the argument, if it is not a nodel Object.
+static PyObject* to_py_number(PyObject* po) {
+    if (!NodelObject_CheckExact(po)) return Py_NewRef(po);
+    auto& obj = ((NodelObject*)po)->obj;
+    switch (obj.type()) {
+        case Object::BOOL:  return PyBool_FromLong(obj.as<bool>());
+        case Object::INT:   return PyLong_FromLongLong(obj.as<Int>());
+        case Object::UINT:  return PyLong_FromUnsignedLongLong(obj.as<UInt>());
+        case Object::FLOAT: return PyFloat_FromDouble(obj.as<Float>());
+        default:
+            python::raise_type_error(obj);
+            return NULL;
+    }
+}
+
+static bool as_int(PyObject* po, Int& value) {
+    if (NodelObject_CheckExact(po)) {
+        auto& obj = ((NodelObject*)po)->obj;
+        if (obj.type() != Object::INT) return false;
+        value = obj.as<Int>();
+        return true;
+    } else if (PyLong_CheckExact(po)) {
+        int overflow;
+        value = PyLong_AsLongLongAndOverflow(po, &overflow);
+        return overflow == 0;
+    }
+    return false;
+}
+
+// Either operand may be the nodel Object, since the slots are also called for
+// the reflected operation.
+static PyObject* number_op(NumberOp op, PyObject* lhs, PyObject* rhs) {
+    // fast path: 64-bit integers, without leaving the registers unless it overflows
+    Int l, r;
+    if (as_int(lhs, l) && as_int(rhs, r)) {
+        Int result;
+        bool overflow = false;
+        switch (op) {
+            case NumberOp::ADD:      overflow = __builtin_add_overflow(l, r, &result); break;
+            case NumberOp::SUBTRACT: overflow = __builtin_sub_overflow(l, r, &result); break;
+            case NumberOp::MULTIPLY: overflow = __builtin_mul_overflow(l, r, &result); break;
+        }
+        if (!overflow) return (PyObject*)NodelObject_wrap(result);
+    }
+
+    // otherwise, defer to Python arithmetic
+    RefMgr py_lhs = to_py_number(lhs);
+    if (py_lhs == NULL) return NULL;
+    RefMgr py_rhs = to_py_number(rhs);
+    if (py_rhs == NULL) return NULL;
+
+    PyObject* py_result = NULL;
+    switch (op) {
+        case NumberOp::ADD:      py_result = PyNumber_Add(py_lhs, py_rhs); break;
+        case NumberOp::SUBTRACT: py_result = PyNumber_Subtract(py_lhs, py_rhs); break;
+        case NumberOp::MULTIPLY: py_result = PyNumber_Multiply(py_lhs, py_rhs); break;
+    }
+    if (py_result == NULL) return NULL;
+    RefMgr result_ref = py_result;
+
+    Object result = support.to_object(py_result);
+    if (PyErr_Occurred()) return NULL;
+    return (PyObject*)NodelObject_wrap(result);
+}
+
 static PyObject* NodelObject_add(PyObject* self, PyObject* arg) {
-    NodelObject* nd_self = (NodelObject*)self;
-    auto& self_obj = nd_self->obj;
-    if (!require_number(self_obj)) return NULL;
-    python::raise_error(PyExc_RuntimeError, "Not implemented, yet");
-    return NULL;
+    return number_op(NumberOp::ADD, self, arg);
 }
 
 static PyObject* NodelObject_subtract(PyObject* self, PyObject* arg) {
-    NodelObject* nd_self = (NodelObject*)self;
-    auto& self_obj = nd_self->obj;
-    if (!require_number(self_obj)) return NULL;
-    python::raise_error(PyExc_RuntimeError, "Not implemented, yet");
-    return NULL;
+    return number_op(NumberOp::SUBTRACT, self, arg);
 }
 
 static PyObject* NodelObject_multiply(PyObject* self, PyObject* arg) {
-    NodelObject* nd_self = (NodelObject*)self;
-    auto& self_obj = nd_self->obj;
-    if (!require_number(self_obj)) return NULL;
-    python::raise_error(PyExc_RuntimeError, "Not implemented, yet");
-    return NULL;
+    return number_op(NumberOp::MULTIPLY, self, arg);
 }
 
 static PyObject* NodelObject_remainder(PyObject* self, PyObject* arg) {
@@ -219,27 +275,15 @@ static PyObject* NodelObject_float(PyObject* self) {
 }
 
 static PyObject* NodelObject_inplace_add(PyObject* self, PyObject* arg) {
-    NodelObject* nd_self = (NodelObject*)self;
-    auto& self_obj = nd_self->obj;
-    if (!require_number(self_obj)) return NULL;
-    python::raise_error(PyExc_RuntimeError, "Not implemented, yet");
-    return NULL;
+    return number_op(NumberOp::ADD, self, arg);
 }
 
 static PyObject* NodelObject_inplace_subtract(PyObject* self, PyObject* arg) {
-    NodelObject* nd_self = (NodelObject*)self;
-    auto& self_obj = nd_self->obj;
-    if (!require_number(self_obj)) return NULL;
-    python::raise_error(PyExc_RuntimeError, "Not implemented, yet");
-    return NULL;
+    return number_op(NumberOp::SUBTRACT, self, arg);
 }
 
 static PyObject* NodelObject_inplace_multiply(PyObject* self, PyObject* arg) {
-    NodelObject* nd_self = (NodelObject*)self;
-    auto& self_obj = nd_self->obj;
-    if (!require_number(self_obj)) return NULL;
-    python::raise_error(PyExc_RuntimeError, "Not implemented, yet");
-    return NULL;
+    return number_op(NumberOp::MULTIPLY, self, arg);
 }
 
 static PyObject* NodelObject_inplace_remainder(PyObject* self, PyObject* arg) {
@@ -558,16 +602,90 @@ static PyMethodDef NodelObject_methods[] = {
 // Type slots
 //-----------------------------------------------------------------------------
 
+// Shared instances for small integers, similar to the CPython small int cache.
+// By-value Objects have no identity, parent, or reference count, so sharing
+// the wrapper is indistinguishable except by the Python 'is' keyword.
+constexpr long small_int_min = -5;
+constexpr long small_int_max = 256;
+static PyObject* small_ints[small_int_max - small_int_min + 1];
+
+// Recently freed wrappers, similar to the CPython float freelist.
+static python::FreeList<NodelObject, 1024> freelist;
+
+static PyObject* NodelObject_alloc(PyTypeObject* type, Py_ssize_t nitems) {
+    if (type != &NodelObjectType) return PyType_GenericAlloc(type, nitems);
+    return freelist.alloc(type);
+}
+
+static PyObject* small_int(PyTypeObject* type, long value) {
+    auto& cached = small_ints[value - small_int_min];
+    if (cached == NULL) {
+        cached = type->tp_alloc(type, 0);
+        if (cached == NULL) return NULL;
+        std::construct_at<Object>(&((NodelObject*)cached)->obj, (Int)value);
+    }
+    return Py_NewRef(cached);
+}
+
+// Shared instance for nil, which, like a small integer, is by-value and immutable.
+static PyObject* nil_object = NULL;
+
+static PyObject* shared_nil(PyTypeObject* type) {
+    if (nil_object == NULL) {
+        nil_object = type->tp_alloc(type, 0);
+        if (nil_object == NULL) return NULL;
+        std::construct_at<Object>(&((NodelObject*)nil_object)->obj, nil);
+    }
+    return Py_NewRef(nil_object);
+}
+
+static bool is_small_int(PyObject* self) {
+    auto& obj = ((NodelObject*)self)->obj;
+    if (obj.type() != Object::INT) return false;
+    auto value = obj.as<Int>();
+    return value >= small_int_min && value <= small_int_max && small_ints[value - small_int_min] == self;
+}
+
+// Returns true, if the arguments are those from which NodelObject_new created the
+// shared nil or small integer, which is what a call of nodel.Object passes to __init__.
+static bool is_shared_init(PyObject* self, PyObject* args, PyObject* kwds) {
+    if ((kwds != NULL && PyDict_GET_SIZE(kwds) != 0) || PyTuple_GET_SIZE(args) != 1) return false;
+    PyObject* arg = PyTuple_GET_ITEM(args, 0);
+    if (self == nil_object) return arg == Py_None;
+    if (!PyLong_CheckExact(arg)) return false;
+    int overflow;
+    long value = PyLong_AsLongAndOverflow(arg, &overflow);
+    return overflow == 0 && value == ((NodelObject*)self)->obj.as<Int>();
+}
+
 static PyObject* NodelObject_new(PyTypeObject* type, PyObject* args, PyObject* kwds) {
+    if (kwds == NULL && PyTuple_GET_SIZE(args) == 1) {
+        PyObject* arg = PyTuple_GET_ITEM(args, 0);
+        if (arg == Py_None) return shared_nil(type);
+        if (PyLong_CheckExact(arg)) {
+            int overflow;
+            long value = PyLong_AsLongAndOverflow(arg, &overflow);
+            if (overflow == 0 && value >= small_int_min && value <= small_int_max)
+                return small_int(type, value);
+        }
+    }
     return type->tp_alloc(type, 0);
 }
 
 static int NodelObject_init(PyObject* self, PyObject* args, PyObject* kwds) {
+    if (self == nil_object || is_small_int(self)) {
+        // shared, so it was initialized by NodelObject_new, and must not change
+        if (is_shared_init(self, args, kwds)) return 0;
+        PyErr_SetString(PyExc_TypeError, "A shared nodel.Object cannot be re-initialized");
+        return -1;
+    }
+
     NodelObject* nd_self = (NodelObject*)self;
     std::construct_at<Object>(&nd_self->obj);
+    Py_CLEAR(nd_self->native);
 
     PyObject* arg = NULL;  // borrowed reference
-    if (!PyArg_ParseTuple(args, "|O", &arg))
+    if (!PyArg_UnpackTuple(args, "Object", 0, 1, &arg))
         return -1;
 
     if (arg != NULL) {
@@ -581,6 +699,8 @@ static int NodelObject_init(PyObject* self, PyObject* args, PyObject* kwds) {
 static void NodelObject_dealloc(PyObject* self) {
     NodelObject* nd_self = (NodelObject*)self;
     std::destroy_at<Object>(&nd_self->obj);
+    Py_CLEAR(nd_self->native);
+    if (Py_TYPE(self) == &NodelObjectType && freelist.push(self)) return;
     Py_TYPE(self)->tp_free(self);
 }
 
@@ -607,6 +727,20 @@ static PyObject* NodelObject_richcompare(PyObject* self, PyObject* other, int op
     Object obj;
     if (NodelObject_CheckExact(other)) {
         obj = ((NodelObject*)other)->obj;
+    } else if (PyUnicode_CheckExact(other) && nd_self->obj.type() == Object::STR) {
+        // compare against the UTF-8 cached on the Python string, without copying it
+        Py_ssize_t size;
+        const char* buf = PyUnicode_AsUTF8AndSize(other, &size);
+        if (buf == NULL) return NULL;
+        auto cmp = StringView{nd_self->obj.as<String>()} <=> StringView{buf, (StringView::size_type)size};
+        Py_RETURN_RICHCOMPARE(cmp, 0, op);
+    } else if (PyLong_CheckExact(other)) {
+        int overflow;
+        Int value = PyLong_AsLongLongAndOverflow(other, &overflow);
+        obj = (overflow == 0)? Object{value}: support.to_object(other);
+        if (PyErr_Occurred()) return NULL;
+    } else if (PyFloat_CheckExact(other)) {
+        obj = PyFloat_AS_DOUBLE(other);
     } else {
         obj = support.to_object(other);
         if (PyErr_Occurred()) return NULL;
@@ -624,18 +758,63 @@ static PyObject* NodelObject_richcompare(PyObject* self, PyObject* other, int op
     return NULL;
 }
 
+// Keys for recently used attribute names, so that map attribute access skips the
+// intern table lookup.  Each entry holds a borrowed reference to its name, which
+// may have been freed, and its address reused by another string, so a hit is
+// confirmed by comparing the text of the key with the UTF-8 cached on the name.
+// Interned keys are per-thread, so the cache is, too.
+constexpr size_t attr_cache_size = 64;
+struct AttrCacheEntry { PyObject* name; Key key; };
+static thread_local AttrCacheEntry attr_cache[attr_cache_size];
+
+static const Key* attr_key(PyObject* name) {
+    Py_ssize_t size;
+    const char* buf = PyUnicode_AsUTF8AndSize(name, &size);
+    if (buf == NULL) return NULL;
+    StringView text{buf, (StringView::size_type)size};
+
+    auto& entry = attr_cache[((uintptr_t)name >> 4) % attr_cache_size];
+    if (entry.name != name || entry.key.as<StringView>() != text) {
+        entry.key = text;
+        entry.name = name;
+    }
+    return &entry.key;
+}
+
 static PyObject* NodelObject_getattro(PyObject* self, PyObject* name) {
+    NodelObject* nd_self = (NodelObject*)self;
+    Object& self_obj = nd_self->obj;
+
+    // fast path: a map key that is not also an attribute of the type is looked up
+    // directly, without raising and clearing an AttributeError first.
+    // _PyType_Lookup is private CPython API, which is not in the limited API or
+    // PyPy, so it is only used with the releases it has been checked against.
+#if !defined(Py_LIMITED_API) && !defined(PYPY_VERSION) && PY_VERSION_HEX < 0x030F0000
+    if (PyUnicode_CheckExact(name) && nodel::is_map(self_obj) && _PyType_Lookup(Py_TYPE(self), name) == NULL) {
+        try {
+            const Key* key = attr_key(name);
+            if (key == NULL) return NULL;
+            return (PyObject*)NodelObject_wrap(self_obj.get(*key));
+        } catch (const WrongType& exc) {
+            python::raise_type_error(self_obj);
+        } catch (const std::exception& exc) {
+            PyErr_SetString(PyExc_RuntimeError, exc.what());
+        }
+        return NULL;
+    }
+#endif
+
     PyObject* val = PyObject_GenericGetAttr(self, name);
-    if (val != NULL) return val;
+    if (val != NULL || !PyErr_ExceptionMatches(PyExc_AttributeError)) return val;
 
     PyErr_Clear();
 
-    NodelObject* nd_self = (NodelObject*)self;
-    Object& self_obj = nd_self->obj;
     try {
         return (PyObject*)NodelObject_wrap(self_obj.get(support.to_key(name)));
     } catch (const WrongType& exc) {
         python::raise_type_error(self_obj);
+    } catch (const std::exception& exc) {
+        PyErr_SetString(PyExc_RuntimeError, exc.what());
     }
 
     return NULL;
@@ -702,6 +881,7 @@ PyTypeObject NodelObjectType = {
     .tp_iter        = &NodelObject_iter,
     .tp_methods     = NodelObject_methods,
     .tp_init        = NodelObject_init,
+    .tp_alloc       = NodelObject_alloc,
     .tp_new         = NodelObject_new,
 };
 
@@ -711,13 +891,18 @@ PyTypeObject NodelObjectType = {
 //-----------------------------------------------------------------------------
 
 NodelObject* NodelObject_wrap(const Object& obj) {
-    PyObject* module = PyState_FindModule(&nodel_module_def);
-    if (module == NULL) return NULL;
+    if (obj == nil) return (NodelObject*)shared_nil(&NodelObjectType);
+    if (obj.is_type<Int>()) {
+        auto value = obj.as<Int>();
+        if (value >= small_int_min && value <= small_int_max)
+            return (NodelObject*)small_int(&NodelObjectType, (long)value);
+    }
 
-    NodelObject* nd_obj = (NodelObject*)PyObject_CallMethodObjArgs(module, PyUnicode_InternFromString("Object"), NULL);
+    // allocate directly, instead of calling the type, so that wrapping skips tp_new and tp_init
+    NodelObject* nd_obj = (NodelObject*)NodelObject_alloc(&NodelObjectType, 0);
     if (nd_obj == NULL) return NULL;
 
-    nd_obj->obj = obj;
+    std::construct_at<Object>(&nd_obj->obj, obj);
     return nd_obj;
 }
 
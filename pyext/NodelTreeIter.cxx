@@ -14,12 +14,19 @@ extern "C" {
 // Type slots
 //-----------------------------------------------------------------------------
 
+// Recently freed iterators, reused by NodelTreeIter_alloc.
+static nodel::python::FreeList<NodelTreeIter, 16> freelist;
+
+static PyObject* NodelTreeIter_alloc(PyTypeObject* type, Py_ssize_t nitems) {
+    return freelist.alloc(type);
+}
+
 static int NodelTreeIter_init(PyObject* self, PyObject* args, PyObject* kwds) {
     NodelTreeIter* nd_self = (NodelTreeIter*)self;
 
-    std::construct_at<TreeRange>(&nd_self->range);
-    std::construct_at<TreeIterator>(&nd_self->it);
-    std::construct_at<TreeIterator>(&nd_self->end);
+    std::construct_at<::TreeRange>(&nd_self->range);
+    std::construct_at<::TreeIterator>(&nd_self->it);
+    std::construct_at<::TreeIterator>(&nd_self->end);
 
     return 0;
 }
@@ -27,11 +34,11 @@ static int NodelTreeIter_init(PyObject* self, PyObject* args, PyObject* kwds) {
 static void NodelTreeIter_dealloc(PyObject* self) {
     NodelTreeIter* nd_self = (NodelTreeIter*)self;
 
-    std::destroy_at<TreeRange>(&nd_self->range);
-    std::destroy_at<TreeIterator>(&nd_self->it);
-    std::destroy_at<TreeIterator>(&nd_self->end);
+    std::destroy_at<::TreeRange>(&nd_self->range);
+    std::destroy_at<::TreeIterator>(&nd_self->it);
+    std::destroy_at<::TreeIterator>(&nd_self->end);
 
-    Py_TYPE(self)->tp_free(self);
+    if (!freelist.push(self)) Py_TYPE(self)->tp_free(self);
 }
 
 static PyObject* NodelTreeIter_str(PyObject* self) {
@@ -43,7 +50,7 @@ static PyObject* NodelTreeIter_repr(PyObject* arg) {
 }
 
 static PyObject* NodelTreeIter_iter(PyObject* self) {
-    return self;
+    return Py_NewRef(self);
 }
 
 static PyObject* NodelTreeIter_iter_next(PyObject* self) {
@@ -69,6 +76,7 @@ PyTypeObject NodelTreeIterType = {
     .tp_iter        = NodelTreeIter_iter,
     .tp_iternext    = NodelTreeIter_iter_next,
     .tp_init        = NodelTreeIter_init,
+    .tp_alloc       = NodelTreeIter_alloc,
 };
 
 } // extern C
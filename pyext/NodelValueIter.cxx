@@ -16,12 +16,20 @@ using namespace nodel;
 // Type slots
 //-----------------------------------------------------------------------------
 
+// Recently freed iterators, reused by NodelValueIter_alloc.
+static nodel::python::FreeList<NodelValueIter, 16> freelist;
+
+static PyObject* NodelValueIter_alloc(PyTypeObject* type, Py_ssize_t nitems) {
+    return freelist.alloc(type);
+}
+
 static int NodelValueIter_init(PyObject* self, PyObject* args, PyObject* kwds) {
     NodelValueIter* nd_self = (NodelValueIter*)self;
 
     std::construct_at<ValueRange>(&nd_self->range);
     std::construct_at<ValueIterator>(&nd_self->it);
     std::construct_at<ValueIterator>(&nd_self->end);
+    nd_self->length_hint = -1;
 
     return 0;
 }
@@ -33,7 +41,7 @@ static void NodelValueIter_dealloc(PyObject* self) {
     std::destroy_at<ValueIterator>(&nd_self->it);
     std::destroy_at<ValueIterator>(&nd_self->end);
 
-    Py_TYPE(self)->tp_free(self);
+    if (!freelist.push(self)) Py_TYPE(self)->tp_free(self);
 }
 
 static PyObject* NodelValueIter_str(PyObject* self) {
@@ -45,7 +53,7 @@ static PyObject* NodelValueIter_repr(PyObject* arg) {
 }
 
 static PyObject* NodelValueIter_iter(PyObject* self) {
-    return self;
+    return Py_NewRef(self);
 }
 
 static PyObject* NodelValueIter_iter_next(PyObject* self) {
@@ -53,9 +61,21 @@ static PyObject* NodelValueIter_iter_next(PyObject* self) {
     if (nd_self->it == nd_self->end) return NULL;  // StopIteration implied
     PyObject* next = (PyObject*)NodelObject_wrap(*nd_self->it);
     ++nd_self->it;
+    if (nd_self->length_hint > 0) --nd_self->length_hint;
     return next;
 }
 
+static PyObject* NodelValueIter_length_hint(PyObject* self, PyObject*) {
+    Py_ssize_t length_hint = ((NodelValueIter*)self)->length_hint;
+    if (length_hint < 0) Py_RETURN_NOTIMPLEMENTED;
+    return PyLong_FromSsize_t(length_hint);
+}
+
+static PyMethodDef NodelValueIter_methods[] = {
+    {"__length_hint__", (PyCFunction)NodelValueIter_length_hint, METH_NOARGS, NULL},
+    {NULL, NULL, 0, NULL}
+};
+
 //-----------------------------------------------------------------------------
 // Type definition
 //-----------------------------------------------------------------------------
@@ -70,7 +90,9 @@ PyTypeObject NodelValueIterType = {
     .tp_doc         = PyDoc_STR("Nodel value iterator"),
     .tp_iter        = NodelValueIter_iter,
     .tp_iternext    = NodelValueIter_iter_next,
+    .tp_methods     = NodelValueIter_methods,
     .tp_init        = NodelValueIter_init,
+    .tp_alloc       = NodelValueIter_alloc,
 };
 
 } // extern C
@@ -9,6 +9,7 @@
 #include <nodel/pyext/NodelItemIter.hxx>
 #include <nodel/pyext/NodelTreeIter.hxx>
 #include <nodel/pyext/support.hxx>
+#include <nodel/pyext/capi.hxx>
 #include <nodel/support/intern.hxx>
 #include <nodel/parser/json.hxx>
 #include <nodel/core.hxx>
@@ -28,22 +29,26 @@ extern "C" {
 
 PyObject* nodel_sentinel = nullptr;
 
-static python::Support support;
+using python::support;
 
 //-----------------------------------------------------------------------------
 // Utility functions
 //-----------------------------------------------------------------------------
 
 inline
-NodelObject* wrap(PyObject* mod, const Object& obj) {
-    NodelObject* nd_obj = (NodelObject*)PyObject_CallMethodObjArgs(mod, PyUnicode_InternFromString("Object"), NULL);
-    if (nd_obj != NULL) nd_obj->obj = obj;
-    return nd_obj;
+NodelObject* as_nodel_object(PyObject* arg) {
+    return NodelObject_CheckExact(arg)? (NodelObject*)arg: NULL;
 }
 
 inline
-NodelObject* as_nodel_object(PyObject* arg) {
-    return NodelObject_CheckExact(arg)? (NodelObject*)arg: NULL;
+Py_ssize_t length_hint(const Object& obj) {
+    if (has_data_source(obj)) return -1;  // avoid loading just for a hint
+    switch (obj.type()) {
+        case Object::LIST:
+        case Object::SMAP:
+        case Object::OMAP: return (Py_ssize_t)obj.size();
+        default:           return -1;
+    }
 }
 
 PyObject* iter_keys(PyObject* arg) {
@@ -52,16 +57,17 @@ PyObject* iter_keys(PyObject* arg) {
 
     NodelKeyIter* nit = (NodelKeyIter*)NodelKeyIterType.tp_alloc(&NodelKeyIterType, 0);
     if (nit == NULL) return NULL;
-    if (NodelKeyIterType.tp_init((PyObject*)nit, NULL, NULL) == -1) return NULL;
+    if (NodelKeyIterType.tp_init((PyObject*)nit, NULL, NULL) == -1) { Py_DECREF(nit); return NULL; }
 
     try {
         nit->range = nd_self->obj.iter_keys();
         nit->it = nit->range.begin();
         nit->end = nit->range.end();
+        nit->length_hint = length_hint(nd_self->obj);
 
-        Py_INCREF(nit);
         return (PyObject*)nit;
     } catch (const NodelException& ex) {
+        Py_DECREF(nit);
         PyErr_SetString(PyExc_RuntimeError, ex.what());
         return NULL;
     }
@@ -78,7 +84,7 @@ constexpr auto mod_bind_doc = "Bind object with URI string/dict\n"
 static PyObject* mod_bind(PyObject* mod, PyObject* arg) {
     try {
         URI uri{support.to_object(arg)};
-        return (PyObject*)wrap(mod, bind(uri));
+        return (PyObject*)NodelObject_wrap(bind(uri));
     } catch (const NodelException& ex) {
         PyErr_SetString(PyExc_RuntimeError, ex.what());
         return NULL;
@@ -86,25 +92,30 @@ static PyObject* mod_bind(PyObject* mod, PyObject* arg) {
 }
 
 constexpr auto mod_from_json_doc = "Parse JSON into an Object\n"
-                                   "from_json(json) -> Object";
+                                   "from_json(json) -> Object\n"
+                                   "The argument may be a str, or a bytes-like object containing UTF-8,\n"
+                                   "which is parsed in place without first being copied to a str.";
 
 static PyObject* mod_from_json(PyObject* mod, PyObject* arg) {
-    Py_ssize_t size;
-    auto c_str = PyUnicode_AsUTF8AndSize(arg, &size);
-    if (c_str == NULL) return NULL;
-
-    RefMgr po = PyObject_CallMethodObjArgs(mod, PyUnicode_InternFromString("Object"), NULL);
-    if (po == NULL) return NULL;
-
-    NodelObject* obj = (NodelObject*)po.get();
-    std::string_view spec{c_str, (std::string_view::size_type)size};
-    obj->obj = json::parse(spec);
-    if (!obj->obj.is_valid()) {
-        PyErr_SetString(PyExc_ValueError, obj->obj.to_str().data());
+    Object result;
+    if (PyUnicode_Check(arg)) {
+        Py_ssize_t size;
+        auto c_str = PyUnicode_AsUTF8AndSize(arg, &size);
+        if (c_str == NULL) return NULL;
+        result = json::parse(std::string_view{c_str, (std::string_view::size_type)size});
+    } else {
+        Py_buffer view;
+        if (PyObject_GetBuffer(arg, &view, PyBUF_SIMPLE) == -1) return NULL;
+        result = json::parse(std::string_view{(const char*)view.buf, (std::string_view::size_type)view.len});
+        PyBuffer_Release(&view);
+    }
+
+    if (!result.is_valid()) {
+        PyErr_SetString(PyExc_ValueError, result.to_str().data());
         return NULL;
     }
 
-    return po.get_clear();
+    return (PyObject*)NodelObject_wrap(result);
 }
 
 constexpr auto clear_method_doc =
@@ -139,7 +150,7 @@ constexpr auto root_method_doc =
 static PyObject* mod_root(PyObject* mod, PyObject* arg) {
     NodelObject* nd_self = as_nodel_object(arg);
     if (nd_self == NULL) return NULL;
-    return (PyObject*)wrap(mod, nd_self->obj.root());
+    return (PyObject*)NodelObject_wrap(nd_self->obj.root());
 }
 
 constexpr auto parent_method_doc =
@@ -151,7 +162,7 @@ constexpr auto parent_method_doc =
 static PyObject* mod_parent(PyObject* mod, PyObject* arg) {
     NodelObject* nd_self = as_nodel_object(arg);
     if (nd_self == NULL) return NULL;
-    return (PyObject*)wrap(mod, nd_self->obj.parent());
+    return (PyObject*)NodelObject_wrap(nd_self->obj.parent());
 }
 
 constexpr auto iter_keys_method_doc =
@@ -184,16 +195,17 @@ static PyObject* mod_iter_values(PyObject* mod, PyObject* arg) {
 
     NodelValueIter* nit = (NodelValueIter*)NodelValueIterType.tp_alloc(&NodelValueIterType, 0);
     if (nit == NULL) return NULL;
-    if (NodelValueIterType.tp_init((PyObject*)nit, NULL, NULL) == -1) return NULL;
+    if (NodelValueIterType.tp_init((PyObject*)nit, NULL, NULL) == -1) { Py_DECREF(nit); return NULL; }
 
     try {
         nit->range = nd_self->obj.iter_values();
         nit->it = nit->range.begin();
         nit->end = nit->range.end();
+        nit->length_hint = length_hint(nd_self->obj);
 
-        Py_INCREF(nit);
         return (PyObject*)nit;
     } catch (const NodelException& ex) {
+        Py_DECREF(nit);
         PyErr_SetString(PyExc_RuntimeError, ex.what());
         return NULL;
     }
@@ -215,16 +227,17 @@ static PyObject* mod_iter_items(PyObject* mod, PyObject* arg) {
 
     NodelItemIter* nit = (NodelItemIter*)NodelItemIterType.tp_alloc(&NodelItemIterType, 0);
     if (nit == NULL) return NULL;
-    if (NodelItemIterType.tp_init((PyObject*)nit, NULL, NULL) == -1) return NULL;
+    if (NodelItemIterType.tp_init((PyObject*)nit, NULL, NULL) == -1) { Py_DECREF(nit); return NULL; }
 
     try {
         nit->range = nd_self->obj.iter_items();
         nit->it = nit->range.begin();
         nit->end = nit->range.end();
+        nit->length_hint = length_hint(nd_self->obj);
 
-        Py_INCREF(nit);
         return (PyObject*)nit;
     } catch (const NodelException& ex) {
+        Py_DECREF(nit);
         PyErr_SetString(PyExc_RuntimeError, ex.what());
         return NULL;
     }
@@ -246,16 +259,16 @@ static PyObject* mod_iter_tree(PyObject* mod, PyObject* arg) {
 
     NodelTreeIter* nit = (NodelTreeIter*)NodelTreeIterType.tp_alloc(&NodelTreeIterType, 0);
     if (nit == NULL) return NULL;
-    if (NodelTreeIterType.tp_init((PyObject*)nit, NULL, NULL) == -1) return NULL;
+    if (NodelTreeIterType.tp_init((PyObject*)nit, NULL, NULL) == -1) { Py_DECREF(nit); return NULL; }
 
     try {
         nit->range = nd_self->obj.iter_tree();
         nit->it = nit->range.begin();
         nit->end = nit->range.end();
 
-        Py_INCREF(nit);
         return (PyObject*)nit;
     } catch (const NodelException& ex) {
+        Py_DECREF(nit);
         PyErr_SetString(PyExc_RuntimeError, ex.what());
         return NULL;
     }
@@ -364,6 +377,87 @@ static PyObject* mod_is_same(PyObject* mod, PyObject* const* args, Py_ssize_t na
     if (lhs->obj.is(rhs->obj)) Py_RETURN_TRUE; else Py_RETURN_FALSE;
 }
 
+constexpr auto native_method_doc =
+"Convert an Object to the equivalent native Python object.\n"
+"nodel.native(obj) -> None|bool|int|float|str|list|dict\n"
+"Containers are converted recursively. If the argument is not a nodel Object then\n"
+"it is returned, unchanged.";
+
+static PyObject* mod_native(PyObject* mod, PyObject* arg) {
+    if (!NodelObject_CheckExact(arg)) return Py_NewRef(arg);
+    NodelObject* nd_obj = (NodelObject*)arg;
+    if (nd_obj->native != NULL) return Py_NewRef(nd_obj->native);
+    try {
+        PyObject* result = support.to_py(nd_obj->obj);
+        if (result == NULL || has_data_source(nd_obj->obj)) return result;
+        switch (nd_obj->obj.type()) {
+            // by-value, so they cannot be changed through another wrapper, or in place,
+            // unlike a string, which nodel.clear empties
+            case Object::NIL:
+            case Object::BOOL:
+            case Object::INT:
+            case Object::UINT:
+            case Object::FLOAT: nd_obj->native = Py_NewRef(result); break;
+            default:            break;
+        }
+        return result;
+    } catch (const NodelException& ex) {
+        PyErr_SetString(PyExc_RuntimeError, ex.what());
+        return NULL;
+    }
+}
+
+// Returns True if the argument is a nodel Object of either type.
+static PyObject* type_test(PyObject* arg, Object::ReprIX type_1, Object::ReprIX type_2) {
+    if (!NodelObject_CheckExact(arg)) Py_RETURN_FALSE;
+    try {
+        auto type = ((NodelObject*)arg)->obj.type();
+        if (type == type_1 || type == type_2) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    } catch (const NodelException& ex) {
+        PyErr_SetString(PyExc_RuntimeError, ex.what());
+        return NULL;
+    }
+}
+
+constexpr auto is_nil_method_doc =
+"True, if the argument is a nil Object.\n"
+"nodel.is_nil(obj) -> bool\n"
+"The type tests, `is_nil`, `is_bool`, `is_int`, `is_float`, `is_str`, `is_list`, and\n"
+"`is_map`, compare the type of the Object without converting it, and return False\n"
+"if the argument is not a nodel Object.";
+
+constexpr auto is_bool_method_doc =
+"True, if the argument is a boolean Object.\n"
+"nodel.is_bool(obj) -> bool";
+
+constexpr auto is_int_method_doc =
+"True, if the argument is a signed or unsigned integer Object.\n"
+"nodel.is_int(obj) -> bool";
+
+constexpr auto is_float_method_doc =
+"True, if the argument is a float Object.\n"
+"nodel.is_float(obj) -> bool";
+
+constexpr auto is_str_method_doc =
+"True, if the argument is a string Object.\n"
+"nodel.is_str(obj) -> bool";
+
+constexpr auto is_list_method_doc =
+"True, if the argument is a list Object.\n"
+"nodel.is_list(obj) -> bool";
+
+constexpr auto is_map_method_doc =
+"True, if the argument is a sorted or ordered map Object.\n"
+"nodel.is_map(obj) -> bool";
+
+static PyObject* mod_is_nil(PyObject* mod, PyObject* arg)   { return type_test(arg, Object::NIL, Object::NIL); }
+static PyObject* mod_is_bool(PyObject* mod, PyObject* arg)  { return type_test(arg, Object::BOOL, Object::BOOL); }
+static PyObject* mod_is_int(PyObject* mod, PyObject* arg)   { return type_test(arg, Object::INT, Object::UINT); }
+static PyObject* mod_is_float(PyObject* mod, PyObject* arg) { return type_test(arg, Object::FLOAT, Object::FLOAT); }
+static PyObject* mod_is_str(PyObject* mod, PyObject* arg)   { return type_test(arg, Object::STR, Object::STR); }
+static PyObject* mod_is_list(PyObject* mod, PyObject* arg)  { return type_test(arg, Object::LIST, Object::LIST); }
+static PyObject* mod_is_map(PyObject* mod, PyObject* arg)   { return type_test(arg, Object::SMAP, Object::OMAP); }
+
 
 static PyMethodDef nodel_methods[] = {
     {"bind",        (PyCFunction)mod_bind,                METH_O,        PyDoc_STR(mod_bind_doc)},
@@ -380,10 +474,112 @@ static PyMethodDef nodel_methods[] = {
     {"reset_key",   (PyCFunction)mod_reset_key,           METH_FASTCALL, PyDoc_STR(reset_key_method_doc)},
     {"save",        (PyCFunction)mod_save,                METH_O,        PyDoc_STR(save_method_doc)},
     {"is_same",     (PyCFunction)mod_is_same,             METH_FASTCALL, PyDoc_STR(is_same_method_doc)},
+    {"native",      (PyCFunction)mod_native,              METH_O,        PyDoc_STR(native_method_doc)},
+    {"is_nil",      (PyCFunction)mod_is_nil,              METH_O,        PyDoc_STR(is_nil_method_doc)},
+    {"is_bool",     (PyCFunction)mod_is_bool,             METH_O,        PyDoc_STR(is_bool_method_doc)},
+    {"is_int",      (PyCFunction)mod_is_int,              METH_O,        PyDoc_STR(is_int_method_doc)},
+    {"is_float",    (PyCFunction)mod_is_float,            METH_O,        PyDoc_STR(is_float_method_doc)},
+    {"is_str",      (PyCFunction)mod_is_str,              METH_O,        PyDoc_STR(is_str_method_doc)},
+    {"is_list",     (PyCFunction)mod_is_list,             METH_O,        PyDoc_STR(is_list_method_doc)},
+    {"is_map",      (PyCFunction)mod_is_map,              METH_O,        PyDoc_STR(is_map_method_doc)},
     {NULL, NULL, 0, NULL}
 };
 
 
+//-----------------------------------------------------------------------------
+// C API
+//-----------------------------------------------------------------------------
+
+static PyObject* capi_from_long_long(long long value) {
+    return (PyObject*)NodelObject_wrap(Object{(Int)value});
+}
+
+static PyObject* capi_from_double(double value) {
+    return (PyObject*)NodelObject_wrap(Object{(Float)value});
+}
+
+static PyObject* capi_from_string_and_size(const char* str, Py_ssize_t size) {
+    return (PyObject*)NodelObject_wrap(Object{String{str, (String::size_type)size}});
+}
+
+static int capi_type(PyObject* po) {
+    if (!NodelObject_CheckExact(po)) {
+        PyErr_SetString(PyExc_TypeError, "Expected nodel.Object");
+        return -1;
+    }
+    try {
+        return ((NodelObject*)po)->obj.type();
+    } catch (const NodelException& ex) {
+        PyErr_SetString(PyExc_RuntimeError, ex.what());
+        return -1;
+    }
+}
+
+static int capi_as_long_long(PyObject* po, long long* value) {
+    int type = capi_type(po);
+    if (type == -1) return -1;
+    auto& obj = ((NodelObject*)po)->obj;
+    if (type == Object::INT) {
+        *value = obj.as<Int>();
+        return 0;
+    } else if (type == Object::UINT) {
+        if (obj.as<UInt>() > (UInt)std::numeric_limits<long long>::max()) {
+            PyErr_SetString(PyExc_OverflowError, "nodel.Object integer too large to convert to long long");
+            return -1;
+        }
+        *value = (long long)obj.as<UInt>();
+        return 0;
+    }
+    python::raise_type_error(obj);
+    return -1;
+}
+
+static int capi_str_into(PyObject* po, char* buf, size_t cap, size_t* out_len) {
+    int type = capi_type(po);
+    if (type == -1) return -1;
+    auto& obj = ((NodelObject*)po)->obj;
+
+    auto write = [buf, cap, out_len] (const StringView& text) {
+        *out_len = text.size();
+        std::memcpy(buf, text.data(), std::min(text.size(), cap));
+        return 0;
+    };
+
+    try {
+        switch (type) {
+            case Object::NIL:   return write("nil");
+            case Object::BOOL:  return write(obj.as<bool>()? "true": "false");
+            case Object::INT:   return write(int_to_str(obj.as<Int>()));
+            case Object::UINT:  return write(int_to_str(obj.as<UInt>()));
+            case Object::FLOAT: {
+                // the same formatting as the Python float type
+                char* text = PyOS_double_to_string(obj.as<Float>(), 'r', 0, Py_DTSF_ADD_DOT_0, NULL);
+                if (text == NULL) return -1;
+                write(text);
+                PyMem_Free(text);
+                return 0;
+            }
+            case Object::STR:   return write(obj.as<String>());
+            default:            return write(obj.to_str());
+        }
+    } catch (const NodelException& ex) {
+        PyErr_SetString(PyExc_RuntimeError, ex.what());
+        return -1;
+    }
+}
+
+static NodelCAPI nodel_capi = {
+    .Size              = sizeof(NodelCAPI),
+    .ObjectType        = &NodelObjectType,
+    .FromLongLong      = capi_from_long_long,
+    .FromDouble        = capi_from_double,
+    .FromStringAndSize = capi_from_string_and_size,
+    .Type              = capi_type,
+    .AsLongLong        = capi_as_long_long,
+    .StrInto           = capi_str_into,
+};
+
+
 //-----------------------------------------------------------------------------
 // Module definition
 //-----------------------------------------------------------------------------
@@ -427,6 +623,13 @@ PyInit_nodel(void)
         return NULL;
     }
 
+    PyObject* capsule = PyCapsule_New(&nodel_capi, NodelCAPI_CAPSULE_NAME, NULL);
+    if (capsule == NULL || PyModule_AddObject(module, "_C_API", capsule) < 0) {
+        Py_XDECREF(capsule);
+        Py_DECREF(module);
+        return NULL;
+    }
+
 //    Py_INCREF(&NodelKeyIterType);
 //    if (PyModule_AddObject(module, "_KeyIter", (PyObject*)&NodelKeyIterType) < 0) {
 //        Py_DECREF(&NodelKeyIterType);
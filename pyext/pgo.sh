@@ -0,0 +1,27 @@
+#!/bin/bash
+#
+# Two-stage profile-guided optimization build of the extension.
+# Expects the same NODEL_PYEXT_INCLUDE/NODEL_PYEXT_LIB_PATH environment as build.sh.
+#
+
+CWD=$( cd -- "$( dirname -- "${BASH_SOURCE[0]}" )" &> /dev/null && pwd )
+pushd $CWD
+
+export NODEL_PGO_DIR=$CWD/build/pgo
+rm -rf $NODEL_PGO_DIR
+
+# stage 1: instrumented build
+NODEL_PGO_STAGE=gen python setup.py build_ext --inplace --force || exit
+
+# collect a profile
+python pgo_train.py ../test_data || exit
+
+# clang writes raw profiles that must be merged
+if ls $NODEL_PGO_DIR/*.profraw &> /dev/null; then
+    llvm-profdata merge -output=$NODEL_PGO_DIR/default.profdata $NODEL_PGO_DIR/*.profraw || exit
+fi
+
+# stage 2: optimized build
+NODEL_PGO_STAGE=use python setup.py build_ext --inplace --force || exit
+
+popd
@@ -0,0 +1,43 @@
+"""Training workload for the profile-guided optimization build (see pgo.sh).
+
+Exercises the hot paths of the extension: JSON parsing and serialization,
+attribute and subscript access, and the key/value/item/tree iterators.
+"""
+import os
+import sys
+import nodel as nd
+
+
+def train(data_dir, rounds):
+    for _ in range(rounds):
+        wd = nd.bind(f'file://?path={data_dir}')
+        for name in nd.iter_keys(wd):
+            obj = wd[name]
+            if not name.endswith('.json'):
+                continue
+
+            for _ in nd.iter_tree(obj):
+                pass
+
+            copy = nd.from_json(str(obj))
+            assert str(copy) == str(obj)
+
+            for _ in range(10):
+                for node in nd.iter_tree(copy):
+                    nd.key(node)
+                    nd.parent(node)
+
+            for record in nd.iter_values(copy):
+                try:
+                    items = list(nd.iter_items(record))
+                except RuntimeError:
+                    continue
+                for key, _ in items:
+                    if isinstance(key, str) and key.isidentifier():
+                        getattr(record, key)
+
+
+if __name__ == '__main__':
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), '..', 'test_data')
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    train(os.path.abspath(data_dir), rounds)
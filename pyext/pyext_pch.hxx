@@ -0,0 +1,19 @@
+/// @b License: @n Apache License v2.0
+/// @copyright Robert Dunnagan
+///
+/// Precompiled header for the extension (see NODEL_PCH in setup.py).
+/// Lists the stable headers shared by all of the extension's sources.
+#pragma once
+
+#include <Python.h>
+
+#include <nodel/core.hxx>
+#include <nodel/filesystem.hxx>
+
+#include <nodel/pyext/module.hxx>
+#include <nodel/pyext/NodelObject.hxx>
+#include <nodel/pyext/NodelKeyIter.hxx>
+#include <nodel/pyext/NodelValueIter.hxx>
+#include <nodel/pyext/NodelItemIter.hxx>
+#include <nodel/pyext/NodelTreeIter.hxx>
+#include <nodel/pyext/support.hxx>
@@ -1,45 +1,392 @@
+from concurrent.futures import ThreadPoolExecutor
 from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+try:
+    from setuptools.modified import newer_group
+except ImportError:
+    from distutils.dep_util import newer_group
+import functools
 import os
-import re
 import glob
+import shutil
+import subprocess
 import sys
+import sysconfig
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
 
-nodel_rocksdb = os.environ.get('NODEL_PYEXT_INCLUDE') is not None
-nodel_pyext_include = re.split(r'\s+', os.environ.get('NODEL_PYEXT_INCLUDE'))
-nodel_pyext_lib_path = re.split(r'\s+', os.environ.get('NODEL_PYEXT_LIB_PATH'))
-
-cond_libs = [
-    ('dwarf', 1),
-    ('zstd', 1),
-    ('cpptrace', 1),
-    ('fmt', 1),
-    ('ziplib', 1),
-    ('rocksdb', nodel_rocksdb)
+setup_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Route compiles through ccache (or sccache) when one is installed; set
+# NODEL_NO_CCACHE=1 to opt out.
+compiler_launchers = ('ccache', 'sccache')
+compiler_launcher = next(filter(None, map(shutil.which, compiler_launchers)), None)
+if compiler_launcher and not os.environ.get('NODEL_NO_CCACHE') and sys.platform != 'win32':
+    for var in ('CC', 'CXX'):
+        compiler = os.environ.get(var) or sysconfig.get_config_var(var) or 'cc'
+        if os.path.basename(compiler.split()[0]) not in compiler_launchers:
+            os.environ[var] = f'{compiler_launcher} {compiler}'
+    os.environ.setdefault('CCACHE_COMPILERCHECK', 'content')
+    os.environ.setdefault('CCACHE_SLOPPINESS', 'pch_defines,time_macros,include_file_mtime')
+
+nodel_dir = os.path.dirname(setup_dir)
+
+# Build configuration from [tool.nodel] in pyproject.toml.  The environment
+# variables noted there override the configured values.
+with open(os.path.join(setup_dir, 'pyproject.toml'), 'rb') as f:
+    config = tomllib.load(f).get('tool', {}).get('nodel', {})
+
+
+def envsplit(name):
+    """Split a whitespace, or CMake ';', separated list from the environment."""
+    return os.environ.get(name, '').replace(';', ' ').split()
+
+
+# Dependencies are found in the CMake build tree (build/_deps), or in depends/
+# (see build.sh), unless NODEL_PYEXT_INCLUDE/NODEL_PYEXT_LIB_PATH are given.
+nodel_depends_dirs = [os.path.join(nodel_dir, 'build', '_deps'), os.path.join(nodel_dir, 'depends'),
+                      os.path.join(nodel_dir, 'deps')]
+
+
+@functools.lru_cache(maxsize=None)
+def depends_index():
+    """Map the name of each file and directory under the dependency directories to
+    the sorted list of directories containing it."""
+    index = {}
+    for depends_dir in nodel_depends_dirs:
+        for root, dirs, files in os.walk(depends_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for name in dirs + files:
+                index.setdefault(name, []).append(root)
+    for roots in index.values():
+        roots.sort()
+    return index
+
+
+def find_includes(headers):
+    """Return the include directories from which the given header paths, such as
+    'fmt/format.h', resolve."""
+    index = depends_index()
+    include_dirs = []
+    for header in headers:
+        subdir, name = os.path.split(os.path.normpath(header))
+        roots = [root for root in index.get(name, []) if root.endswith(os.sep + subdir)]
+        if not roots:
+            sys.exit(f'Unable to find {header} in {nodel_depends_dirs}; set NODEL_PYEXT_INCLUDE')
+        include_dirs.append(roots[0][:-len(os.sep + subdir)])
+    return include_dirs
+
+
+def find_libs(names):
+    """Return the directories containing the named libraries.  Libraries that are
+    not found are left to the linker's default search path."""
+    index = depends_index()
+    lib_dirs = []
+    for name in names:
+        for file_name in (f'lib{name}.a', f'lib{name}.so', f'lib{name}.dylib', f'{name}.lib'):
+            if file_name in index:
+                lib_dirs.append(index[file_name][0])
+                break
+    return sorted(set(lib_dirs))
+
+
+nodel_rocksdb = os.environ.get('NODEL_ROCKSDB', '1' if config.get('rocksdb') else '0') != '0'
+
+# Link jemalloc, which RocksDB uses when it is built with WITH_JEMALLOC=ON.
+nodel_jemalloc = os.environ.get('NODEL_JEMALLOC', '1' if config.get('jemalloc') else '0') != '0'
+if 'NODEL_PYEXT_INCLUDE' in os.environ:
+    nodel_pyext_include = envsplit('NODEL_PYEXT_INCLUDE')
+elif config.get('include-dirs'):
+    nodel_pyext_include = [os.path.join(setup_dir, path) for path in config['include-dirs']]
+else:
+    nodel_pyext_include = [nodel_dir] + find_includes(
+        ['tsl/ordered_map.h', 'fmt/format.h', 'cpptrace/cpptrace.hpp', 'ZipLib/ZipFile.h'])
+
+# Link-time optimization is on by default; set NODEL_LTO=0 to disable it.
+# The static dependencies must be built with LTO, too (see CMakeLists.txt),
+# or cross-module inlining stops at the archive boundary.
+nodel_lto = os.environ.get('NODEL_LTO', '1') != '0'
+
+# Profile-guided optimization (see pgo.sh): NODEL_PGO_STAGE is 'gen' to build
+# an instrumented extension, or 'use' to build with the collected profile.
+nodel_pgo_stage = os.environ.get('NODEL_PGO_STAGE')
+nodel_pgo_dir = os.path.abspath(os.environ.get('NODEL_PGO_DIR', os.path.join(setup_dir, 'build', 'pgo')))
+
+# Target instruction set: NODEL_MARCH is 'none' (the default) to use the
+# compiler's default, which runs on any host, or any -march value, such as
+# 'x86-64-v2', 'x86-64-v3' (AVX2) or 'native' (which also tunes for the build
+# host) for builds that only run on matching hardware.  NODEL_FAST_MATH=1
+# enables -ffast-math, which breaks the NaN semantics of Object comparison, so
+# it is off by default.
+nodel_march = os.environ.get('NODEL_MARCH', 'none')
+nodel_fast_math = os.environ.get('NODEL_FAST_MATH', '0') != '0'
+
+# Linker: NODEL_LINKER is 'lld', 'mold', 'gold' or 'bfd', or 'default' to use
+# the compiler's default.  When unset, the fastest installed linker that can
+# handle the build is chosen on Linux (lld cannot link gcc LTO objects).
+nodel_linker = os.environ.get('NODEL_LINKER')
+
+# NODEL_RELEASE=1 limits debug information to line tables and strips the
+# built extension.
+nodel_release = os.environ.get('NODEL_RELEASE', '0') != '0'
+
+# Translation units are compiled in parallel; NODEL_BUILD_JOBS limits the
+# number of concurrent compiles (LTO builds are memory hungry).
+nodel_build_jobs = int(os.environ.get('NODEL_BUILD_JOBS', os.cpu_count() or 1))
+
+# NODEL_UNITY=1 compiles the extension as a single translation unit, which
+# gives the optimizer the whole extension at once (when LTO is unavailable).
+nodel_unity = os.environ.get('NODEL_UNITY', '0') != '0'
+
+# NODEL_PCH=1 precompiles the headers in pyext_pch.hxx once, instead of
+# parsing them for each source.
+nodel_pch = os.environ.get('NODEL_PCH', '0') != '0'
+
+# Object files are only rebuilt when their source, or a Nodel header, changes.
+nodel_headers = glob.glob(os.path.join(setup_dir, '..', 'nodel', '**', '*.hxx'), recursive=True)
+
+cond_libs = [(lib, 1) for lib in config.get('libs', [])] + [
+    ('rocksdb', nodel_rocksdb),
+    ('jemalloc', nodel_jemalloc)
 ]
 
+if 'NODEL_PYEXT_LIB_PATH' in os.environ:
+    nodel_pyext_lib_path = envsplit('NODEL_PYEXT_LIB_PATH')
+elif config.get('lib-dirs'):
+    nodel_pyext_lib_path = [os.path.join(setup_dir, path) for path in config['lib-dirs']]
+else:
+    nodel_pyext_lib_path = find_libs([lib for (lib, cond) in cond_libs if cond])
+
+# Optimization level, keyed by compiler family, overriding Python's default.
+# -fno-semantic-interposition lets the compiler inline and call functions with
+# default visibility directly.  On ELF platforms, -fno-plt calls into libpython
+# through the GOT instead of the PLT.
+opt_args = {
+    'clang': ['-O3', '-fno-semantic-interposition'] + (['-fno-plt'] if sys.platform == 'linux' else []),
+    'gcc':   ['-O3', '-fno-semantic-interposition'] + (['-fno-plt'] if sys.platform == 'linux' else []),
+    'msvc':  ['/O2'],
+}
+
+# (compile args, link args) keyed by compiler family
+lto_args = {
+    'clang': (['-flto=thin'], ['-flto=thin']),
+    'gcc':   (['-flto'], ['-flto', '-fuse-linker-plugin']),
+    'msvc':  (['/GL'], ['/LTCG']),
+}
+
+# (compile args, link args) keyed by PGO stage and compiler family
+pgo_args = {
+    'gen': {
+        'clang': (['-fprofile-generate=' + nodel_pgo_dir], ['-fprofile-generate=' + nodel_pgo_dir]),
+        'gcc':   (['-fprofile-generate=' + nodel_pgo_dir], ['-fprofile-generate=' + nodel_pgo_dir]),
+        'msvc':  ([], ['/GENPROFILE']),
+    },
+    'use': {
+        'clang': (['-fprofile-use=' + os.path.join(nodel_pgo_dir, 'default.profdata')], []),
+        'gcc':   (['-fprofile-use=' + nodel_pgo_dir, '-fprofile-correction'], ['-fprofile-use=' + nodel_pgo_dir]),
+        'msvc':  ([], ['/USEPROFILE']),
+    },
+}
+
+# (compile args, link args) keyed by platform, which hide every symbol except
+# PyInit_nodel (exported by PyMODINIT_FUNC), including those of the static
+# dependencies, and drop unreferenced code.
+visibility_args = {
+    'linux':  (['-fvisibility=hidden', '-fvisibility-inlines-hidden', '-ffunction-sections', '-fdata-sections'],
+               ['-Wl,--exclude-libs,ALL', '-Wl,--gc-sections']),
+    'darwin': (['-fvisibility=hidden', '-fvisibility-inlines-hidden', '-ffunction-sections', '-fdata-sections'],
+               ['-Wl,-dead_strip']),
+}
+
+
+def arch_args(family):
+    """Return the compile args selecting the target instruction set."""
+    args = []
+    if family == 'msvc':
+        if nodel_march in ('native', 'x86-64-v3', 'x86-64-v4'):
+            args.append('/arch:AVX2')
+        if nodel_fast_math:
+            args.append('/fp:fast')
+    else:
+        if nodel_march != 'none':
+            args.append('-march=' + nodel_march)
+        if nodel_march == 'native':
+            args.append('-mtune=native')
+        if nodel_fast_math:
+            args.append('-ffast-math')
+    return args
+
+
+def linker_args(family):
+    """Return the link args selecting the linker."""
+    if family == 'msvc':
+        return []
+    linker = nodel_linker
+    if linker is None and sys.platform == 'linux':
+        candidates = ['lld', 'mold', 'gold'] if (family == 'clang' or not nodel_lto) else ['mold', 'gold']
+        executables = {'lld': 'ld.lld', 'mold': 'mold', 'gold': 'ld.gold'}
+        linker = next((name for name in candidates if shutil.which(executables[name])), None)
+    return ['-fuse-ld=' + linker] if linker and linker != 'default' else []
+
+
+def compiler_family(compiler):
+    """Return 'msvc', 'clang' or 'gcc' for the compiler chosen by build_ext."""
+    if compiler.compiler_type == 'msvc':
+        return 'msvc'
+    command = [arg for arg in compiler.compiler_so if os.path.basename(arg) not in compiler_launchers]
+    try:
+        version = subprocess.run(command[:1] + ['--version'],
+                                 capture_output=True, text=True).stdout
+    except OSError:
+        return 'gcc'
+    return 'clang' if 'clang' in version else 'gcc'
+
+
+class BuildExt(build_ext):
+    def finalize_options(self):
+        # Keep object files in the source tree, rather than pip's temporary build
+        # directory, so that rebuilds are incremental.
+        if self.build_temp is None:
+            self.build_temp = os.path.join(setup_dir, 'build',
+                                           f'temp.{sysconfig.get_platform()}-{sys.implementation.cache_tag}')
+        super().finalize_options()
+        if not self.parallel:
+            self.parallel = nodel_build_jobs
+
+    def run(self):
+        super().run()
+        if nodel_release and self.compiler.compiler_type != 'msvc':
+            strip = ['strip', '-x'] if sys.platform == 'darwin' else ['strip', '--strip-unneeded']
+            for ext in self.extensions:
+                path = self.get_ext_fullpath(ext.name)
+                if os.path.exists(path):
+                    self.spawn(strip + [path])
+
+    def build_extensions(self):
+        family = compiler_family(self.compiler)
+        for ext in self.extensions:
+            if nodel_unity:
+                ext.depends = ext.depends + ext.sources
+                ext.sources = [self.write_unity_source(ext)]
+            ext.extra_compile_args += opt_args[family] + arch_args(family)
+            if nodel_release and family != 'msvc':
+                ext.extra_compile_args.append('-g1')
+            if family != 'msvc' and sys.platform in visibility_args:
+                compile_args, link_args = visibility_args[sys.platform]
+                ext.extra_compile_args += compile_args
+                ext.extra_link_args += link_args
+            ext.extra_link_args += linker_args(family)
+            if nodel_lto:
+                compile_args, link_args = lto_args[family]
+                ext.extra_compile_args += compile_args
+                ext.extra_link_args += link_args
+            if nodel_pgo_stage:
+                compile_args, link_args = pgo_args[nodel_pgo_stage][family]
+                ext.extra_compile_args += compile_args
+                ext.extra_link_args += link_args
+        super().build_extensions()
+
+    def write_unity_source(self, ext):
+        """Write a source file including all of the extension's sources, and return its path."""
+        path = os.path.join(self.build_temp, f'{ext.name}_unity.cxx')
+        text = ''.join(f'#include "{os.path.abspath(source)}"\n'.replace(os.sep, '/') for source in ext.sources)
+        os.makedirs(self.build_temp, exist_ok=True)
+        if not os.path.exists(path) or open(path).read() != text:
+            with open(path, 'w') as f:
+                f.write(text)
+        return os.path.relpath(path)
+
+    def build_pch(self, ext, force):
+        """Precompile pyext_pch.hxx for the extension, and return True if it was rebuilt."""
+        family = compiler_family(self.compiler)
+        header = os.path.join(setup_dir, 'pyext_pch.hxx')
+        macros = [f'{k}={v}' for (k, v) in ext.define_macros]
+        include_dirs = ext.include_dirs + self.compiler.include_dirs
+        if family == 'msvc':
+            pch = os.path.join(self.build_temp, 'pyext_pch.pch')
+            stub = os.path.join(self.build_temp, 'pyext_pch.cxx')
+            os.makedirs(self.build_temp, exist_ok=True)
+            with open(stub, 'w') as f:
+                f.write('#include "pyext_pch.hxx"\n')
+            pch_args = ['/Fp' + pch]
+            ext.extra_objects += self.compiler.object_filenames([stub], output_dir=self.build_temp)
+            rebuild = force or newer_group([header] + ext.depends, pch)
+            if rebuild:
+                self.compiler.compile([stub], output_dir=self.build_temp, macros=ext.define_macros,
+                                      include_dirs=[setup_dir] + include_dirs,
+                                      extra_postargs=ext.extra_compile_args + pch_args + ['/Ycpyext_pch.hxx'])
+            ext.extra_compile_args += pch_args + ['/Yupyext_pch.hxx', '/FIpyext_pch.hxx']
+            return rebuild
+
+        # gcc finds <header>.gch next to the header named by -include
+        pch_header = os.path.join(self.build_temp, 'pyext_pch.hxx')
+        pch = pch_header + ('.pch' if family == 'clang' else '.gch')
+        rebuild = force or newer_group([header] + ext.depends, pch)
+        if rebuild:
+            os.makedirs(self.build_temp, exist_ok=True)
+            shutil.copyfile(header, pch_header)
+            self.compiler.spawn(self.compiler.compiler_so + ext.extra_compile_args +
+                                ['-D' + macro for macro in macros] + ['-I' + path for path in include_dirs] +
+                                ['-x', 'c++-header', pch_header, '-o', pch])
+        if family == 'clang':
+            ext.extra_compile_args += ['-include-pch', pch]
+        else:
+            ext.extra_compile_args += ['-include', pch_header]
+        return rebuild
+
+    def build_extension(self, ext):
+        # Objects are reused only if the compiler flags are unchanged, too.
+        flags = ' '.join(self.compiler.compiler_so + ext.extra_compile_args + [f'{k}={v}' for (k, v) in ext.define_macros])
+        flags_path = os.path.join(self.build_temp, f'{ext.name}.flags')
+        force = self.force or not os.path.exists(flags_path) or open(flags_path).read() != flags
+        if nodel_pch:
+            force = self.build_pch(ext, force) or force
+        compile = self.compiler.compile
+
+        def compile_stale(sources, output_dir=None, depends=None, **kwargs):
+            objects = self.compiler.object_filenames(sources, output_dir=output_dir)
+            stale = [source for (source, obj) in zip(sources, objects)
+                     if force or newer_group([source] + (depends or []), obj)]
+            with ThreadPoolExecutor(max(1, min(len(stale), self.parallel))) as pool:
+                list(pool.map(lambda source: compile([source], output_dir=output_dir, depends=depends, **kwargs), stale))
+            return objects
+
+        self.compiler.compile = compile_stale
+        try:
+            super().build_extension(ext)
+        finally:
+            del self.compiler.compile
+
+        os.makedirs(self.build_temp, exist_ok=True)
+        with open(flags_path, 'w') as f:
+            f.write(flags)
+
+
 setup(
+    cmdclass={'build_ext': BuildExt},
     ext_modules=[
         Extension(
             name='nodel',
             version='0.1',
             url='https://github.com/clutterdesk/Nodel',
-            define_macros=[
-                ('PYNODEL_ROCKSDB', 1 if nodel_rocksdb else 0)
-            ],
+            define_macros=[('PYNODEL_ROCKSDB', 1)] if nodel_rocksdb else [],
             sources=[
-                'module.cxx', 
-                'NodelObject.cxx', 
+                'module.cxx',
+                'NodelObject.cxx',
                 'NodelKeyIter.cxx',
                 'NodelValueIter.cxx',
                 'NodelItemIter.cxx',
                 'NodelTreeIter.cxx'
             ],
+            depends=nodel_headers,
             include_dirs=nodel_pyext_include,
             extra_compile_args=[
                 '--std=c++20',
                 '-Wno-c99-designator',
                 '-Wno-delete-non-abstract-non-virtual-dtor',
-                '-Wno-tautological-undefined-compare', 
+                '-Wno-tautological-undefined-compare',
                 '-Wno-deprecated-declarations',
                 '-Wno-enum-conversion'
             ],
@@ -48,4 +395,4 @@ setup(
             extra_link_args=[]
         ),
     ]
-)
\ No newline at end of file
+)
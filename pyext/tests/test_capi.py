@@ -0,0 +1,104 @@
+"""Checks of the C API table exported as the nodel._C_API capsule (see
+nodel/pyext/capi.hxx), called through ctypes, as another extension would.
+
+Run against a built extension with: python -m unittest discover -s pyext/tests
+"""
+import ctypes
+import unittest
+import nodel as nd
+
+# nodel::Object::ReprIX (see nodel/core/Object.hxx)
+NIL, INT, UINT, FLOAT, STR, LIST = 1, 3, 4, 5, 6, 7
+
+Py_ssize_t = ctypes.c_ssize_t
+c_char_ptr = ctypes.POINTER(ctypes.c_char)
+
+
+# Must match the layout of NodelCAPI in nodel/pyext/capi.hxx.
+class NodelCAPI(ctypes.Structure):
+    _fields_ = [
+        ('Size', ctypes.c_size_t),
+        ('ObjectType', ctypes.c_void_p),
+        ('FromLongLong', ctypes.PYFUNCTYPE(ctypes.py_object, ctypes.c_longlong)),
+        ('FromDouble', ctypes.PYFUNCTYPE(ctypes.py_object, ctypes.c_double)),
+        ('FromStringAndSize', ctypes.PYFUNCTYPE(ctypes.py_object, ctypes.c_char_p, Py_ssize_t)),
+        ('Type', ctypes.PYFUNCTYPE(ctypes.c_int, ctypes.py_object)),
+        ('AsLongLong', ctypes.PYFUNCTYPE(ctypes.c_int, ctypes.py_object, ctypes.POINTER(ctypes.c_longlong))),
+        ('StrInto', ctypes.PYFUNCTYPE(ctypes.c_int, ctypes.py_object, c_char_ptr, ctypes.c_size_t,
+                                      ctypes.POINTER(ctypes.c_size_t))),
+    ]
+
+
+def import_capi():
+    get_pointer = ctypes.pythonapi.PyCapsule_GetPointer
+    get_pointer.restype = ctypes.c_void_p
+    get_pointer.argtypes = [ctypes.py_object, ctypes.c_char_p]
+    return NodelCAPI.from_address(get_pointer(nd._C_API, b'nodel._C_API'))
+
+
+class TestCAPI(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.capi = import_capi()
+
+    def str_into(self, obj, cap):
+        buf = ctypes.create_string_buffer(max(cap, 1))
+        out_len = ctypes.c_size_t()
+        self.assertEqual(self.capi.StrInto(obj, buf, cap, ctypes.byref(out_len)), 0)
+        return buf.raw[:min(cap, out_len.value)], out_len.value
+
+    def test_size(self):
+        self.assertEqual(self.capi.Size, ctypes.sizeof(NodelCAPI))
+
+    def test_object_type(self):
+        self.assertEqual(self.capi.ObjectType, id(nd.Object))
+
+    def test_from_long_long(self):
+        obj = self.capi.FromLongLong(-(2**63))
+        self.assertIsInstance(obj, nd.Object)
+        self.assertEqual(nd.native(obj), -(2**63))
+
+    def test_from_double(self):
+        obj = self.capi.FromDouble(2.5)
+        self.assertIsInstance(obj, nd.Object)
+        self.assertEqual(nd.native(obj), 2.5)
+
+    def test_from_string_and_size(self):
+        obj = self.capi.FromStringAndSize(b'abc\x00def', 7)
+        self.assertIsInstance(obj, nd.Object)
+        self.assertEqual(nd.native(obj), 'abc\x00def')
+
+    def test_type(self):
+        self.assertEqual(self.capi.Type(nd.Object(None)), NIL)
+        self.assertEqual(self.capi.Type(nd.Object(1)), INT)
+        self.assertEqual(self.capi.Type(nd.Object(2**63)), UINT)
+        self.assertEqual(self.capi.Type(nd.Object(1.5)), FLOAT)
+        self.assertEqual(self.capi.Type(nd.Object('x')), STR)
+        self.assertEqual(self.capi.Type(nd.Object([])), LIST)
+        with self.assertRaises(TypeError):
+            self.capi.Type(1)
+
+    def test_as_long_long(self):
+        value = ctypes.c_longlong()
+        self.assertEqual(self.capi.AsLongLong(nd.Object(-7), ctypes.byref(value)), 0)
+        self.assertEqual(value.value, -7)
+        self.assertEqual(self.capi.AsLongLong(nd.Object(2**63 - 1), ctypes.byref(value)), 0)
+        self.assertEqual(value.value, 2**63 - 1)
+        with self.assertRaises(OverflowError):
+            self.capi.AsLongLong(nd.Object(2**63), ctypes.byref(value))
+        with self.assertRaises(TypeError):
+            self.capi.AsLongLong(nd.Object('x'), ctypes.byref(value))
+
+    def test_str_into(self):
+        for obj in (nd.Object(None), nd.Object(True), nd.Object(-12), nd.Object(2**63),
+                    nd.Object(0.1), nd.Object('héllo'), nd.Object([1, 'a'])):
+            text = str(obj).encode()
+            self.assertEqual(self.str_into(obj, 64), (text, len(text)))
+
+    def test_str_into_truncates(self):
+        self.assertEqual(self.str_into(nd.Object('hello'), 2), (b'he', 5))
+        self.assertEqual(self.str_into(nd.Object('hello'), 0), (b'', 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Tests of nodel.native, including the value cached on the wrapper.
+
+Run against a built extension with: python -m unittest discover -s pyext/tests
+"""
+import unittest
+import nodel as nd
+
+
+class TestNative(unittest.TestCase):
+    def test_scalars(self):
+        for value in (None, True, -3, 2**63, 1.5, 'abc'):
+            obj = nd.Object(value)
+            self.assertEqual(nd.native(obj), value)
+            self.assertEqual(nd.native(obj), value)
+
+    def test_not_an_object(self):
+        value = [1]
+        self.assertIs(nd.native(value), value)
+
+    def test_str_after_clear(self):
+        s = nd.Object('abc')
+        self.assertEqual(nd.native(s), 'abc')
+        nd.clear(s)
+        self.assertEqual(str(s), '')
+        self.assertEqual(nd.native(s), '')
+
+    def test_list_after_set(self):
+        obj = nd.Object([1])
+        self.assertEqual(nd.native(obj), [1])
+        obj[0] = 2
+        self.assertEqual(nd.native(obj), [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Smoke tests of nodel.Object arithmetic.
+
+Run against a built extension with: python -m unittest discover -s pyext/tests
+"""
+import unittest
+import nodel as nd
+
+
+class TestNumber(unittest.TestCase):
+    def test_int(self):
+        a = nd.Object(6)
+        self.assertIsInstance(a + 3, nd.Object)
+        self.assertEqual(nd.native(a + 3), 9)
+        self.assertEqual(nd.native(a - nd.Object(10)), -4)
+        self.assertEqual(nd.native(a * 7), 42)
+
+    def test_int_reflected(self):
+        a = nd.Object(6)
+        self.assertIsInstance(3 + a, nd.Object)
+        self.assertEqual(nd.native(3 + a), 9)
+        self.assertEqual(nd.native(10 - a), 4)
+        self.assertEqual(nd.native(7 * a), 42)
+
+    def test_int_overflow(self):
+        big = nd.Object(2**62)
+        self.assertEqual(nd.native(big + big), 2**63)
+        self.assertEqual(nd.native(big * 2), 2**63)
+        self.assertEqual(nd.native(nd.Object(-2**63) + 0), -2**63)
+        self.assertEqual(nd.native(nd.Object(2**63 - 1) - nd.Object(-1)), 2**63)
+
+    def test_mixed_int_float(self):
+        self.assertEqual(nd.native(nd.Object(2) + 0.5), 2.5)
+        self.assertEqual(nd.native(0.5 + nd.Object(2)), 2.5)
+        self.assertEqual(nd.native(nd.Object(1.5) * 2), 3.0)
+        self.assertEqual(nd.native(nd.Object(1.5) - nd.Object(2)), -0.5)
+        self.assertIsInstance(nd.native(nd.Object(2) * 1.0), float)
+
+    def test_inplace(self):
+        a = nd.Object(6)
+        a += 1
+        self.assertEqual(nd.native(a), 7)
+        a -= nd.Object(2)
+        self.assertEqual(nd.native(a), 5)
+        a *= 3
+        self.assertEqual(nd.native(a), 15)
+        a *= 0.5
+        self.assertEqual(nd.native(a), 7.5)
+
+    def test_inplace_overflow(self):
+        a = nd.Object(2**62)
+        a += 2**62
+        self.assertEqual(nd.native(a), 2**63)
+
+    def test_inplace_keeps_shared_small_ints(self):
+        a = nd.Object(5)
+        a += 1
+        self.assertEqual(nd.native(nd.Object(5)), 5)
+
+    def test_wrong_type(self):
+        with self.assertRaises(TypeError):
+            nd.Object([1]) + 1
+
+
+if __name__ == '__main__':
+    unittest.main()
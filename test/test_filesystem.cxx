@@ -11,6 +11,12 @@
 using namespace nodel;
 using namespace nodel::filesystem;
 
+// Cleanup runs in a destructor, so test output is removed without throwing.
+static void remove_test_output(const std::filesystem::path& path) {
+    std::error_code error;
+    std::filesystem::remove_all(path, error);
+}
+
 TEST(Filesystem, IsFsobj) {
     auto wd = std::filesystem::current_path() / "test_data";
     Object test_data = new Directory(new Registry{default_registry()}, wd, DataSource::Origin::SOURCE);
@@ -118,7 +124,7 @@ TEST(Filesystem, CreateDirectory) {
     std::string temp_dir_name = "temp_test_create";
     auto wd = std::filesystem::current_path() / "test_data";
 
-    Finally cleanup{ [&wd, &temp_dir_name] () { std::filesystem::remove(wd / temp_dir_name); } };
+    Finally cleanup{ [&wd, &temp_dir_name] () { remove_test_output(wd / temp_dir_name); } };
 
     Object test_data = new Directory(new Registry{default_registry()}, wd, DataSource::Origin::SOURCE);
     test_data.set(temp_dir_name, new SubDirectory(DataSource::Origin::MEMORY));
@@ -136,7 +142,7 @@ TEST(Filesystem, DeleteDirectory) {
     using Mode = DataSource::Mode;
     auto wd = std::filesystem::current_path() / "test_data";
 
-    Finally cleanup{ [&wd, &temp_dir_name] () { std::filesystem::remove(wd / temp_dir_name); } };
+    Finally cleanup{ [&wd, &temp_dir_name] () { remove_test_output(wd / temp_dir_name); } };
 
     auto p_ds = new Directory(new Registry{default_registry()}, wd, DataSource::Origin::SOURCE);
     p_ds->set_options({Mode::ALL});
@@ -162,7 +168,7 @@ TEST(Filesystem, CreateJsonFile) {
     std::string new_file_name = "new_file.json";
     auto wd = std::filesystem::current_path() / "test_data";
 
-    Finally cleanup{ [&wd, &new_file_name] () { std::filesystem::remove(wd / new_file_name); } };
+    Finally cleanup{ [&wd, &new_file_name] () { remove_test_output(wd / new_file_name); } };
 
     Object test_data = new Directory(new Registry{default_registry()}, wd, DataSource::Origin::SOURCE);
     Object new_file = new SerialFile(new JsonSerializer());
@@ -181,7 +187,7 @@ TEST(Filesystem, CreateCsvFile) {
     std::string new_file_name = "new_file.csv";
     auto wd = std::filesystem::current_path() / "test_data";
 
-    Finally cleanup{ [&wd, &new_file_name] () { std::filesystem::remove(wd / new_file_name); } };
+    Finally cleanup{ [&wd, &new_file_name] () { remove_test_output(wd / new_file_name); } };
 
     Object test_data = new Directory(new Registry{default_registry()}, wd, DataSource::Origin::SOURCE);
     Object new_file = new SerialFile(new CsvSerializer());
@@ -202,7 +208,7 @@ TEST(Filesystem, UpdateJsonFile) {
     std::string new_file_name = "new_file.json";
     auto wd = std::filesystem::current_path() / "test_data";
 
-    Finally cleanup{ [&wd, &new_file_name] () { std::filesystem::remove(wd / new_file_name); } };
+    Finally cleanup{ [&wd, &new_file_name] () { remove_test_output(wd / new_file_name); } };
 
     Object test_data = new Directory(new Registry{default_registry()}, wd, DataSource::Origin::SOURCE);
     Object new_file = new SerialFile(new JsonSerializer());
@@ -222,10 +228,7 @@ TEST(Filesystem, UpdateJsonFile) {
 TEST(Filesystem, CopyFileToAnotherDirectory) {
     auto wd = std::filesystem::current_path() / "test_data";
 
-    Finally cleanup{[&wd] () {
-        std::filesystem::remove(wd / "temp" / "example.json");
-        std::filesystem::remove(wd / "temp");
-    }};
+    Finally cleanup{[&wd] () { remove_test_output(wd / "temp"); }};
 
     Object test_data = new Directory(new Registry{default_registry()}, wd, DataSource::Origin::SOURCE);
     test_data.set("temp"_key, new SubDirectory(DataSource::Origin::MEMORY));
@@ -253,9 +256,7 @@ TEST(Filesystem, LookupDataSourceForNewFile) {
     Object wd = bind("file://?perm=rw&path=."_uri);
     auto path = filesystem::path(wd);
 
-    Finally cleanup{[&path] () {
-        std::filesystem::remove(path / "test_data" / "dummy.txt");
-    }};
+    Finally cleanup{[&path] () { remove_test_output(path / "test_data" / "dummy.txt"); }};
 
     wd["test_data['dummy.txt']"_path] = "tea";
     wd.save();
@@ -2,6 +2,8 @@
 /// @copyright Robert Dunnagan
 #include <gtest/gtest.h>
 #include <sstream>
+#include <cstring>
+#include <limits>
 
 #include <nodel/parser/json.hxx>
 #include <nodel/support/Stopwatch.hxx>
@@ -67,6 +69,54 @@ TEST(Json, ParseNumberRangeError) {
   EXPECT_FALSE(parser.m_curr.is_valid());
 }
 
+TEST(Json, ParseNumberNegativeRangeError) {
+  std::stringstream stream{"-100000000000000000000"};
+  Parser parser{StreamAdapter{stream}};
+  EXPECT_FALSE(parser.parse_number());
+  EXPECT_NE(parser.m_curr.to_str().find(strerror(ERANGE)), std::string::npos);
+}
+
+TEST(Json, ParseNumberIntBounds) {
+  std::stringstream stream1{"-9223372036854775808"};
+  Parser parser1{StreamAdapter{stream1}};
+  ASSERT_TRUE(parser1.parse_number());
+  EXPECT_TRUE(parser1.m_curr.is_type<Int>());
+  EXPECT_EQ(parser1.m_curr.as<Int>(), std::numeric_limits<Int>::min());
+
+  std::stringstream stream2{"9223372036854775807"};
+  Parser parser2{StreamAdapter{stream2}};
+  ASSERT_TRUE(parser2.parse_number());
+  EXPECT_TRUE(parser2.m_curr.is_type<Int>());
+  EXPECT_EQ(parser2.m_curr.as<Int>(), std::numeric_limits<Int>::max());
+
+  std::stringstream stream3{"9223372036854775808"};
+  Parser parser3{StreamAdapter{stream3}};
+  ASSERT_TRUE(parser3.parse_number());
+  EXPECT_TRUE(parser3.m_curr.is_type<UInt>());
+  EXPECT_EQ(parser3.m_curr.as<UInt>(), 9223372036854775808ULL);
+}
+
+TEST(Json, ParseNumberBelowIntMin) {
+  std::stringstream stream{"-9223372036854775809"};
+  Parser parser{StreamAdapter{stream}};
+  EXPECT_FALSE(parser.parse_number());
+  EXPECT_NE(parser.m_curr.to_str().find(strerror(ERANGE)), std::string::npos);
+}
+
+TEST(Json, ParseNumberLeadingPlus) {
+  std::stringstream stream{"+5"};
+  Parser parser{StreamAdapter{stream}};
+  ASSERT_TRUE(parser.parse_number());
+  EXPECT_EQ(parser.m_curr.as<Int>(), 5);
+}
+
+TEST(Json, ParseNumberPlusMinus) {
+  std::stringstream stream{"+-5"};
+  Parser parser{StreamAdapter{stream}};
+  EXPECT_FALSE(parser.parse_number());
+  EXPECT_FALSE(parser.m_curr.is_valid());
+}
+
 TEST(Json, ParseNumberFloat) {
   std::stringstream stream{"3.14159"};
   Parser parser{StreamAdapter{stream}};
@@ -161,6 +211,21 @@ TEST(Json, ParseDoubleQuotedString) {
     EXPECT_EQ(parser.m_curr.as<String>(), "tea");
 }
 
+TEST(Json, ParseEscapedString) {
+    std::stringstream stream{R"("t\"e\\a")"};
+    Parser parser{StreamAdapter{stream}};
+    EXPECT_TRUE(parser.parse_string());
+    EXPECT_EQ(parser.m_curr.as<String>(), "t\"e\\a");
+}
+
+TEST(Json, ParseStringSpanningBuffers) {
+    std::string expect = std::string(4090, 'x') + "\"" + std::string(4090, 'y');
+    std::stringstream stream{"\"" + std::string(4090, 'x') + "\\\"" + std::string(4090, 'y') + "\""};
+    Parser parser{StreamAdapter{stream}};
+    EXPECT_TRUE(parser.parse_string());
+    EXPECT_EQ(parser.m_curr.as<String>(), expect);
+}
+
 TEST(Json, ParseTypeStringDoubleQuote) {
     std::stringstream stream{"\"tea\""};
     Parser parser{StreamAdapter{stream}};
@@ -205,6 +270,21 @@ TEST(Json, ParseExample1) {
     EXPECT_EQ(curr.get("y"_key).get(0), 2);
 }
 
+TEST(Json, ParseMapNonStringKeys) {
+    std::stringstream stream{R"({'x': 1, 7: 2, null: 3})"};
+    Parser parser1{StreamAdapter{stream}};
+    EXPECT_TRUE(parser1.parse_object());
+    Object curr = parser1.m_curr;
+    EXPECT_EQ(curr.size(), 3UL);
+    EXPECT_EQ(curr.get("x"_key), 1);
+    EXPECT_EQ(curr.get(7), 2);
+    EXPECT_EQ(curr.get(nil), 3);
+}
+
+TEST(Json, ParseMapUnterminatedKey) {
+    EXPECT_FALSE(json::parse(R"({"x)").is_valid());
+}
+
 TEST(Json, ParseExampleFile) {
     Object example = json::parse_file("test_data/example.json");
     EXPECT_TRUE(example.is_valid());
@@ -104,6 +104,19 @@ TEST(Object, String) {
   EXPECT_EQ(quoted.to_json(), "\"a\\\"b\"");
 }
 
+TEST(Object, StringEscapes) {
+  Object v{"\\x\"y\\"};
+  EXPECT_EQ(v.to_json(), "\"\\\\x\\\"y\\\\\"");
+  EXPECT_EQ("a\"b"_key.to_json(), "\"a\\\"b\"");
+}
+
+TEST(Object, FloatToStr) {
+  EXPECT_EQ(float_to_str(0.1), "0.1");
+  EXPECT_EQ(float_to_str(1e100), "1e+100");
+  EXPECT_EQ(float_to_str(1.0/3), "0.333333333333333");
+  EXPECT_EQ(float_to_str(-2.5e-7), "-2.5e-07");
+}
+
 TEST(Object, ConstructWithInvalidRepr) {
     try {
         Object v{Object::DSRC};
@@ -1685,6 +1698,14 @@ TEST(Object, DelPath) {
     EXPECT_EQ(obj.get("a"_key).get("b"_key).get(0), "Ceylon");
 }
 
+TEST(Object, DelPathLeafByKey) {
+    Object obj = json::parse(R"({"a": [1, 2, 1]})");
+    obj.del("a[2]"_path);
+    EXPECT_EQ(obj.get("a"_key), "[1, 2]"_json);
+    obj.del("x.y"_path);
+    EXPECT_EQ(obj, R"({"a": [1, 2]})"_json);
+}
+
 TEST(Object, HashPath) {
     std::hash<OPath> hash;
 